@@ -1,7 +1,9 @@
 """
 Schemas package initialization.
 
-Imports all schemas for easy access and documentation.
+Exposes all schemas for easy access and documentation. Submodules are
+imported lazily on first attribute access, so importing one schema does
+not build validators for every other schema module.
 
 Usage:
     from src.schemas import (
@@ -13,113 +15,212 @@ Usage:
     )
 """
 
-# Common schemas
-from src.schemas.common import (
-    PaginationParams,
-    PagedResponse,
-    ErrorDetail,
-    ErrorResponse,
-    HealthResponse,
-    MetadataResponse,
-    SuccessResponse,
-    MessageResponse,
-)
-
-# Authentication schemas
-from src.schemas.auth import (
-    LoginRequest,
-    RegisterRequest,
-    TokenResponse,
-    RefreshTokenRequest,
-    LogoutRequest,
-    UserTokenResponse,
-    ChangePasswordRequest,
-    ForgotPasswordRequest,
-    ResetPasswordRequest,
-    VerifyEmailRequest,
-    ResendVerificationRequest,
-    AuthResponse,
-)
-
-# User schemas
-from src.schemas.users import (
-    UserCreate,
-    UserUpdate,
-    UserResponse,
-    UserDetailResponse,
-    PromoterDetailResponse,
-    BecomePromoterRequest,
-    PromoterResponse,
-    UserListResponse,
-    UserPreferencesUpdate,
-)
-
-# Event schemas
-from src.schemas.events import (
-    EventStatus,
-    EventCreate,
-    EventUpdate,
-    EventResponse,
-    EventDetailResponse,
-    PromoterSummary,
-    TicketTierSummary,
-    PublishEventRequest,
-    CancelEventRequest,
-    EventListResponse,
-)
-
-# Ticket schemas
-from src.schemas.tickets import (
-    TicketStatus,
-    CreateTicketTierRequest,
-    UpdateTicketTierRequest,
-    TicketTierResponse,
-    TicketTierAvailabilityResponse,
-    TicketResponse,
-    TicketDetailResponse,
-    EventTicketInfo,
-    SetAttendeeRequest,
-    TransferTicketRequest,
-    ValidateTicketRequest,
-    ValidateTicketResponse,
-)
-
-# Order schemas
-from src.schemas.orders import (
-    OrderStatus,
-    PaymentStatus,
-    OrderItemRequest,
-    CreateOrderRequest,
-    BillingAddress,
-    CreateOrderWithBillingRequest,
-    OrderItemResponse,
-    OrderResponse,
-    OrderDetailResponse,
-    EventOrderInfo,
-    ConfirmOrderRequest,
-    CancelOrderRequest,
-    RefundOrderRequest,
-    PaymentIntentResponse,
-    OrderListResponse,
-    CreateOrderResponse,
-)
-
-# Waitlist schemas
-from src.schemas.waitlist import (
-    JoinWaitlistRequest,
-    WaitlistResponse,
-    WaitlistDetailResponse,
-    EventWaitlistInfo,
-    TierWaitlistInfo,
-    LeaveWaitlistRequest,
-    WaitlistNotificationResponse,
-    RespondToWaitlistRequest,
-    WaitlistListResponse,
-    JoinWaitlistResponse,
-    WaitlistMetricsResponse,
-    BulkNotifyWaitlistRequest,
-    BulkNotifyResponse,
-)
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    # Common schemas
+    from src.schemas.common import (
+        PaginationParams,
+        PagedResponse,
+        ErrorDetail,
+        ErrorResponse,
+        HealthResponse,
+        MetadataResponse,
+        SuccessResponse,
+        MessageResponse,
+    )
+
+    # Authentication schemas
+    from src.schemas.auth import (
+        LoginRequest,
+        RegisterRequest,
+        TokenResponse,
+        RefreshTokenRequest,
+        LogoutRequest,
+        UserTokenResponse,
+        ChangePasswordRequest,
+        ForgotPasswordRequest,
+        ResetPasswordRequest,
+        VerifyEmailRequest,
+        ResendVerificationRequest,
+        AuthResponse,
+    )
+
+    # User schemas
+    from src.schemas.users import (
+        UserCreate,
+        UserUpdate,
+        UserResponse,
+        UserDetailResponse,
+        PromoterDetailResponse,
+        BecomePromoterRequest,
+        PromoterResponse,
+        UserListResponse,
+        UserPreferencesUpdate,
+    )
+
+    # Event schemas
+    from src.schemas.events import (
+        EventStatus,
+        EventCreate,
+        EventUpdate,
+        EventResponse,
+        EventDetailResponse,
+        PromoterSummary,
+        TicketTierSummary,
+        PublishEventRequest,
+        CancelEventRequest,
+        EventListResponse,
+    )
+
+    # Ticket schemas
+    from src.schemas.tickets import (
+        TicketStatus,
+        CreateTicketTierRequest,
+        UpdateTicketTierRequest,
+        TicketTierResponse,
+        TicketTierAvailabilityResponse,
+        TicketResponse,
+        TicketDetailResponse,
+        EventTicketInfo,
+        SetAttendeeRequest,
+        TransferTicketRequest,
+        ValidateTicketRequest,
+        ValidateTicketResponse,
+    )
+
+    # Order schemas
+    from src.schemas.orders import (
+        OrderStatus,
+        PaymentStatus,
+        OrderStatusValue,
+        PaymentStatusValue,
+        OrderItemRequest,
+        CreateOrderRequest,
+        BillingAddress,
+        CreateOrderWithBillingRequest,
+        OrderItemResponse,
+        OrderResponse,
+        OrderDetailResponse,
+        EventOrderInfo,
+        ConfirmOrderRequest,
+        CancelOrderRequest,
+        RefundOrderRequest,
+        PaymentIntentResponse,
+        OrderListResponse,
+        CreateOrderResponse,
+    )
+
+    # Waitlist schemas
+    from src.schemas.waitlist import (
+        JoinWaitlistRequest,
+        WaitlistResponse,
+        WaitlistDetailResponse,
+        EventWaitlistInfo,
+        TierWaitlistInfo,
+        LeaveWaitlistRequest,
+        WaitlistNotificationResponse,
+        RespondToWaitlistRequest,
+        WaitlistListResponse,
+        JoinWaitlistResponse,
+        WaitlistMetricsResponse,
+        BulkNotifyWaitlistRequest,
+        BulkNotifyResponse,
+    )
+
+# Public name -> submodule (relative to this package) that defines it
+_dynamic_imports: dict[str, str] = {
+    # Common
+    "PaginationParams": ".common",
+    "PagedResponse": ".common",
+    "ErrorDetail": ".common",
+    "ErrorResponse": ".common",
+    "HealthResponse": ".common",
+    "MetadataResponse": ".common",
+    "SuccessResponse": ".common",
+    "MessageResponse": ".common",
+    # Auth
+    "LoginRequest": ".auth",
+    "RegisterRequest": ".auth",
+    "TokenResponse": ".auth",
+    "RefreshTokenRequest": ".auth",
+    "LogoutRequest": ".auth",
+    "UserTokenResponse": ".auth",
+    "ChangePasswordRequest": ".auth",
+    "ForgotPasswordRequest": ".auth",
+    "ResetPasswordRequest": ".auth",
+    "VerifyEmailRequest": ".auth",
+    "ResendVerificationRequest": ".auth",
+    "AuthResponse": ".auth",
+    # Users
+    "UserCreate": ".users",
+    "UserUpdate": ".users",
+    "UserResponse": ".users",
+    "UserDetailResponse": ".users",
+    "PromoterDetailResponse": ".users",
+    "BecomePromoterRequest": ".users",
+    "PromoterResponse": ".users",
+    "UserListResponse": ".users",
+    "UserPreferencesUpdate": ".users",
+    # Events
+    "EventStatus": ".events",
+    "EventCreate": ".events",
+    "EventUpdate": ".events",
+    "EventResponse": ".events",
+    "EventDetailResponse": ".events",
+    "PromoterSummary": ".events",
+    "TicketTierSummary": ".events",
+    "PublishEventRequest": ".events",
+    "CancelEventRequest": ".events",
+    "EventListResponse": ".events",
+    # Tickets
+    "TicketStatus": ".tickets",
+    "CreateTicketTierRequest": ".tickets",
+    "UpdateTicketTierRequest": ".tickets",
+    "TicketTierResponse": ".tickets",
+    "TicketTierAvailabilityResponse": ".tickets",
+    "TicketResponse": ".tickets",
+    "TicketDetailResponse": ".tickets",
+    "EventTicketInfo": ".tickets",
+    "SetAttendeeRequest": ".tickets",
+    "TransferTicketRequest": ".tickets",
+    "ValidateTicketRequest": ".tickets",
+    "ValidateTicketResponse": ".tickets",
+    # Orders
+    "OrderStatus": ".orders",
+    "PaymentStatus": ".orders",
+    "OrderStatusValue": ".orders",
+    "PaymentStatusValue": ".orders",
+    "OrderItemRequest": ".orders",
+    "CreateOrderRequest": ".orders",
+    "BillingAddress": ".orders",
+    "CreateOrderWithBillingRequest": ".orders",
+    "OrderItemResponse": ".orders",
+    "OrderResponse": ".orders",
+    "OrderDetailResponse": ".orders",
+    "EventOrderInfo": ".orders",
+    "ConfirmOrderRequest": ".orders",
+    "CancelOrderRequest": ".orders",
+    "RefundOrderRequest": ".orders",
+    "PaymentIntentResponse": ".orders",
+    "OrderListResponse": ".orders",
+    "CreateOrderResponse": ".orders",
+    # Waitlist
+    "JoinWaitlistRequest": ".waitlist",
+    "WaitlistResponse": ".waitlist",
+    "WaitlistDetailResponse": ".waitlist",
+    "EventWaitlistInfo": ".waitlist",
+    "TierWaitlistInfo": ".waitlist",
+    "LeaveWaitlistRequest": ".waitlist",
+    "WaitlistNotificationResponse": ".waitlist",
+    "RespondToWaitlistRequest": ".waitlist",
+    "WaitlistListResponse": ".waitlist",
+    "JoinWaitlistResponse": ".waitlist",
+    "WaitlistMetricsResponse": ".waitlist",
+    "BulkNotifyWaitlistRequest": ".waitlist",
+    "BulkNotifyResponse": ".waitlist",
+}
 
 __all__ = [
     # Common
@@ -181,6 +282,8 @@ __all__ = [
     # Orders
     "OrderStatus",
     "PaymentStatus",
+    "OrderStatusValue",
+    "PaymentStatusValue",
     "OrderItemRequest",
     "CreateOrderRequest",
     "BillingAddress",
@@ -210,3 +313,18 @@ __all__ = [
     "BulkNotifyWaitlistRequest",
     "BulkNotifyResponse",
 ]
+
+
+def __getattr__(name: str):
+    """Import the submodule defining ``name`` on first access and cache it."""
+    module_name = _dynamic_imports.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = import_module(module_name, package=__name__)
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return list(__all__)
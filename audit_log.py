@@ -2,6 +2,7 @@
 Audit Log model for security and compliance tracking.
 """
 
+import enum
 from datetime import datetime
 from typing import TYPE_CHECKING
 
@@ -9,11 +10,12 @@ from sqlalchemy import (
     DateTime,
     ForeignKey,
     Integer,
+    SmallInteger,
     String,
     Text,
 )
 from sqlalchemy.dialects.postgresql import INET, JSONB
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.orm import Mapped, mapped_column, relationship, validates
 from sqlalchemy.sql import func
 
 from src.core.database import Base
@@ -22,6 +24,28 @@ if TYPE_CHECKING:
     from src.models.users import User
 
 
+class ActionKind(enum.IntEnum):
+    """Normalized category of an audit action, stored as a SMALLINT."""
+
+    OTHER = 0
+    CREATE = 1
+    UPDATE = 2
+    DELETE = 3
+
+
+# Lowercased action verb -> kind, used when an action is assigned
+_ACTION_KINDS: dict[str, ActionKind] = {
+    "create": ActionKind.CREATE,
+    "insert": ActionKind.CREATE,
+    "add": ActionKind.CREATE,
+    "update": ActionKind.UPDATE,
+    "modify": ActionKind.UPDATE,
+    "edit": ActionKind.UPDATE,
+    "delete": ActionKind.DELETE,
+    "remove": ActionKind.DELETE,
+}
+
+
 class AuditLog(Base):
     """Audit log model for tracking critical system actions."""
 
@@ -37,19 +61,26 @@ class AuditLog(Base):
 
     # Action Information
     action: Mapped[str] = mapped_column(String(100), nullable=False, index=True)
+    action_kind: Mapped[int] = mapped_column(
+        SmallInteger, nullable=False, default=ActionKind.OTHER, index=True
+    )
     entity_type: Mapped[str] = mapped_column(String(50), nullable=False, index=True)
     entity_id: Mapped[int | None] = mapped_column(Integer, index=True)
 
-    # Change Tracking
-    old_data: Mapped[dict | None] = mapped_column(JSONB)
-    new_data: Mapped[dict | None] = mapped_column(JSONB)
+    # Change Tracking (deferred: large blobs only needed on detail views,
+    # which opt in with .options(undefer(AuditLog.old_data), ...))
+    old_data: Mapped[dict | None] = mapped_column(JSONB, deferred=True)
+    new_data: Mapped[dict | None] = mapped_column(JSONB, deferred=True)
 
     # Request Information
     ip_address: Mapped[str | None] = mapped_column(INET)
     user_agent: Mapped[str | None] = mapped_column(Text)
 
-    # Metadata
-    metadata: Mapped[dict] = mapped_column(JSONB, default={})
+    # Metadata (``metadata`` is reserved by the declarative base, so the
+    # attribute is renamed while the column keeps its name)
+    event_metadata: Mapped[dict] = mapped_column(
+        "metadata", JSONB, default=dict, nullable=False
+    )
 
     # Timestamp
     created_at: Mapped[datetime] = mapped_column(
@@ -57,27 +88,39 @@ class AuditLog(Base):
     )
 
     # Relationships
-    user: Mapped["User | None"] = relationship("User")
+    # Lazy loads raise instead of silently issuing one query per row; list
+    # queries must opt in with selectinload(AuditLog.user).
+    user: Mapped["User | None"] = relationship("User", lazy="raise_on_sql")
 
     def __repr__(self) -> str:
         return f"<AuditLog(id={self.id}, action={self.action}, entity_type={self.entity_type})>"
 
+    @validates("action")
+    def _set_action_kind(self, key: str, action: str) -> str:
+        """Derive action_kind once, whenever action is assigned."""
+        self.action_kind = _ACTION_KINDS.get(action.lower(), ActionKind.OTHER)
+        return action
+
     @property
     def is_create(self) -> bool:
         """Check if action is a create."""
-        return self.action.lower() in ["create", "insert", "add"]
+        return self.action_kind == ActionKind.CREATE
 
     @property
     def is_update(self) -> bool:
         """Check if action is an update."""
-        return self.action.lower() in ["update", "modify", "edit"]
+        return self.action_kind == ActionKind.UPDATE
 
     @property
     def is_delete(self) -> bool:
         """Check if action is a delete."""
-        return self.action.lower() in ["delete", "remove"]
+        return self.action_kind == ActionKind.DELETE
 
     @property
     def has_changes(self) -> bool:
-        """Check if audit log contains change data."""
+        """
+        Check if audit log contains change data.
+
+        Reads the deferred change columns; load them with ``undefer`` first.
+        """
         return self.old_data is not None or self.new_data is not None
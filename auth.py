@@ -2,35 +2,73 @@
 Authentication schemas for login, register, and token management.
 """
 
-from pydantic import BaseModel, Field, EmailStr, validator
+from pydantic import (
+    AfterValidator,
+    BaseModel,
+    ConfigDict,
+    EmailStr,
+    Field,
+    field_validator,
+    model_validator,
+)
 from datetime import datetime
-from typing import Optional
+from typing import TYPE_CHECKING, Annotated, Optional
+
+from src.schemas.common import ORM_RESPONSE_CONFIG
+
+if TYPE_CHECKING:
+    from src.models.users import User
+
+
+# Inbound email address, validated and normalized to lowercase by pydantic-core
+EmailStrLower = Annotated[EmailStr, AfterValidator(str.lower)]
+
+
+def _validate_password_strength(v: str) -> str:
+    """
+    Ensure a password contains at least one digit and one uppercase letter.
+
+    Both requirements are checked in a single pass that stops as soon as
+    each has been seen.
+    """
+    has_digit = has_upper = False
+    for char in v:
+        if char.isdigit():
+            has_digit = True
+        elif char.isupper():
+            has_upper = True
+        if has_digit and has_upper:
+            return v
+
+    if not has_digit:
+        raise ValueError("Password must contain at least one digit")
+    raise ValueError("Password must contain at least one uppercase letter")
 
 
 class LoginRequest(BaseModel):
     """Login request schema."""
 
-    email: EmailStr = Field(description="User email address")
+    email: EmailStrLower = Field(description="User email address")
     password: str = Field(
         min_length=6,
         max_length=128,
         description="User password (6-128 characters)"
     )
 
-    class Config:
-        """Pydantic configuration."""
-        schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "email": "user@example.com",
                 "password": "securepassword123"
             }
         }
+    )
 
 
 class RegisterRequest(BaseModel):
     """User registration request schema."""
 
-    email: EmailStr = Field(description="Email address for new account")
+    email: EmailStrLower = Field(description="Email address for new account")
     password: str = Field(
         min_length=8,
         max_length=128,
@@ -48,25 +86,21 @@ class RegisterRequest(BaseModel):
         description="Last name"
     )
 
-    @validator("password")
-    def validate_password_strength(cls, v):
+    @field_validator("password")
+    @classmethod
+    def validate_password_strength(cls, v: str) -> str:
         """Validate password strength."""
-        if not any(char.isdigit() for char in v):
-            raise ValueError("Password must contain at least one digit")
-        if not any(char.isupper() for char in v):
-            raise ValueError("Password must contain at least one uppercase letter")
-        return v
-
-    @validator("password_confirm")
-    def passwords_match(cls, v, values):
+        return _validate_password_strength(v)
+
+    @model_validator(mode="after")
+    def passwords_match(self) -> "RegisterRequest":
         """Validate that passwords match."""
-        if "password" in values and v != values["password"]:
+        if self.password != self.password_confirm:
             raise ValueError("Passwords do not match")
-        return v
+        return self
 
-    class Config:
-        """Pydantic configuration."""
-        schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "email": "newuser@example.com",
                 "password": "SecurePass123!",
@@ -75,20 +109,23 @@ class RegisterRequest(BaseModel):
                 "last_name": "Doe"
             }
         }
+    )
 
 
 class TokenResponse(BaseModel):
     """JWT token response schema."""
 
     access_token: str = Field(description="JWT access token (15 min expiration)")
-    refresh_token: str = Field(description="JWT refresh token (7 day expiration)")
+    refresh_token: Optional[str] = Field(
+        default=None,
+        description="JWT refresh token (7 day expiration); issued at login",
+    )
     token_type: str = Field(default="bearer", description="Token type")
     expires_in: int = Field(description="Access token expiration time in seconds (900)")
     user: "UserTokenResponse" = Field(description="User information")
 
-    class Config:
-        """Pydantic configuration."""
-        schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "access_token": "eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9...",
                 "refresh_token": "eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9...",
@@ -103,6 +140,25 @@ class TokenResponse(BaseModel):
                 }
             }
         }
+    )
+
+
+class AccessTokenResponse(BaseModel):
+    """Access token response for a refresh."""
+
+    access_token: str = Field(description="JWT access token (15 min expiration)")
+    token_type: str = Field(default="bearer", description="Token type")
+    expires_in: int = Field(description="Access token expiration time in seconds (900)")
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "access_token": "eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9...",
+                "token_type": "bearer",
+                "expires_in": 900
+            }
+        }
+    )
 
 
 class RefreshTokenRequest(BaseModel):
@@ -110,13 +166,13 @@ class RefreshTokenRequest(BaseModel):
 
     refresh_token: str = Field(description="Valid refresh token")
 
-    class Config:
-        """Pydantic configuration."""
-        schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "refresh_token": "eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9..."
             }
         }
+    )
 
 
 class LogoutRequest(BaseModel):
@@ -137,9 +193,23 @@ class UserTokenResponse(BaseModel):
     last_name: str = Field(description="Last name")
     role: str = Field(description="User role (user, promoter, admin)")
 
-    class Config:
-        """Pydantic configuration."""
-        from_attributes = True
+    model_config = ORM_RESPONSE_CONFIG
+
+    @classmethod
+    def from_user(cls, user: "User") -> "UserTokenResponse":
+        """
+        Build from a persisted User without re-running validation.
+
+        The ORM row is already trusted, so ``model_construct`` skips field
+        validation (including email parsing) on the response path.
+        """
+        return cls.model_construct(
+            id=user.id,
+            email=user.email,
+            first_name=user.first_name,
+            last_name=user.last_name,
+            role=user.role.value,
+        )
 
 
 class ChangePasswordRequest(BaseModel):
@@ -153,27 +223,24 @@ class ChangePasswordRequest(BaseModel):
     )
     new_password_confirm: str = Field(description="New password confirmation")
 
-    @validator("new_password")
-    def validate_new_password(cls, v):
+    @field_validator("new_password")
+    @classmethod
+    def validate_new_password(cls, v: str) -> str:
         """Validate new password strength."""
-        if not any(char.isdigit() for char in v):
-            raise ValueError("Password must contain at least one digit")
-        if not any(char.isupper() for char in v):
-            raise ValueError("Password must contain at least one uppercase letter")
-        return v
-
-    @validator("new_password_confirm")
-    def passwords_match(cls, v, values):
+        return _validate_password_strength(v)
+
+    @model_validator(mode="after")
+    def passwords_match(self) -> "ChangePasswordRequest":
         """Validate that new passwords match."""
-        if "new_password" in values and v != values["new_password"]:
+        if self.new_password != self.new_password_confirm:
             raise ValueError("Passwords do not match")
-        return v
+        return self
 
 
 class ForgotPasswordRequest(BaseModel):
     """Forgot password request schema."""
 
-    email: EmailStr = Field(description="Email address for password reset")
+    email: EmailStrLower = Field(description="Email address for password reset")
 
 
 class ResetPasswordRequest(BaseModel):
@@ -187,21 +254,18 @@ class ResetPasswordRequest(BaseModel):
     )
     new_password_confirm: str = Field(description="Password confirmation")
 
-    @validator("new_password")
-    def validate_password(cls, v):
+    @field_validator("new_password")
+    @classmethod
+    def validate_password(cls, v: str) -> str:
         """Validate password strength."""
-        if not any(char.isdigit() for char in v):
-            raise ValueError("Password must contain at least one digit")
-        if not any(char.isupper() for char in v):
-            raise ValueError("Password must contain at least one uppercase letter")
-        return v
-
-    @validator("new_password_confirm")
-    def passwords_match(cls, v, values):
+        return _validate_password_strength(v)
+
+    @model_validator(mode="after")
+    def passwords_match(self) -> "ResetPasswordRequest":
         """Validate passwords match."""
-        if "new_password" in values and v != values["new_password"]:
+        if self.new_password != self.new_password_confirm:
             raise ValueError("Passwords do not match")
-        return v
+        return self
 
 
 class VerifyEmailRequest(BaseModel):
@@ -213,7 +277,7 @@ class VerifyEmailRequest(BaseModel):
 class ResendVerificationRequest(BaseModel):
     """Resend verification email request schema."""
 
-    email: EmailStr = Field(description="Email address to resend verification to")
+    email: EmailStrLower = Field(description="Email address to resend verification to")
 
 
 class AuthResponse(BaseModel):
@@ -222,9 +286,8 @@ class AuthResponse(BaseModel):
     message: str = Field(description="Response message")
     token: Optional[TokenResponse] = Field(default=None, description="Token data if applicable")
 
-    class Config:
-        """Pydantic configuration."""
-        schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "message": "Login successful",
                 "token": {
@@ -242,3 +305,8 @@ class AuthResponse(BaseModel):
                 }
             }
         }
+    )
+
+
+# Resolve the "UserTokenResponse" forward reference once at import time
+TokenResponse.model_rebuild()
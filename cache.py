@@ -0,0 +1,30 @@
+"""
+Shared Redis client for application caches.
+
+The client (and its connection pool) is created on first use and shared
+by every cache module; call ``close_redis()`` on shutdown.
+"""
+
+from typing import Optional
+
+from redis.asyncio import Redis
+
+from src.core.config import settings
+
+_redis: Optional[Redis] = None
+
+
+def get_redis() -> Redis:
+    """Get the shared async Redis client."""
+    global _redis
+    if _redis is None:
+        _redis = Redis.from_url(settings.redis_url)
+    return _redis
+
+
+async def close_redis() -> None:
+    """Close the shared Redis client and its connection pool."""
+    global _redis
+    if _redis is not None:
+        await _redis.aclose()
+        _redis = None
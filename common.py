@@ -4,22 +4,77 @@ Common schemas used across the API.
 Includes pagination, error responses, and shared response models.
 """
 
-from typing import Generic, TypeVar, Optional, Any
+import re
+from functools import lru_cache
+from typing import Annotated, Generic, Literal, TypeVar, Optional, Any
 from datetime import datetime
-from pydantic import BaseModel, Field
+
+import orjson
+from fastapi.responses import ORJSONResponse, Response
+from pydantic import (
+    AfterValidator,
+    BaseModel,
+    ConfigDict,
+    Field,
+    StringConstraints,
+    TypeAdapter,
+)
 
 T = TypeVar("T")
+SortFieldT = TypeVar("SortFieldT", bound=str)
+
+
+# http(s) URL check shared by every URL field: one precompiled pattern
+# instead of pydantic's HttpUrl parser (length limits stay on the Field)
+_HTTP_URL_RE = re.compile(r"^https?://[^\s/?#]+[^\s]*$", re.IGNORECASE)
+
+
+def _check_http_url(v: str) -> str:
+    """Ensure ``v`` is an absolute http(s) URL without whitespace."""
+    if not _HTTP_URL_RE.match(v):
+        raise ValueError("Must be an http(s) URL")
+    return v
+
+
+# Inbound URL kept as a plain str
+HttpUrlStr = Annotated[str, AfterValidator(_check_http_url)]
+
+# Contact email (e.g. billing) checked by a single pattern inside
+# pydantic-core; account emails at registration/login keep EmailStr
+EmailAddressStr = Annotated[
+    str,
+    StringConstraints(pattern=r"^[^@\s]+@[^@\s]+\.[^@\s]+$", max_length=254),
+]
 
 
-class PaginationParams(BaseModel):
-    """Pagination parameters for list endpoints."""
+# Shared by response schemas built from ORM rows. They are read-only once
+# built, so frozen skips the assignment-validation machinery entirely;
+# the other values are pydantic's defaults, pinned so every response
+# serializes the same way
+ORM_RESPONSE_CONFIG = ConfigDict(
+    from_attributes=True,
+    frozen=True,
+    extra="ignore",
+    validate_assignment=False,
+    ser_json_bytes="utf8",
+    ser_json_timedelta="iso8601",
+)
+
+
+class PaginationParams(BaseModel, Generic[SortFieldT]):
+    """
+    Pagination parameters for list endpoints.
+
+    Parameterize with the endpoint's sortable fields so arbitrary (and
+    possibly unindexed) columns are rejected at validation time, e.g.
+    ``PaginationParams[Literal["start_time", "published_at"]]``.
+    """
 
     skip: int = Field(default=0, ge=0, description="Number of items to skip")
     limit: int = Field(default=20, ge=1, le=100, description="Number of items to return")
-    sort_by: Optional[str] = Field(default=None, description="Field to sort by")
-    sort_order: str = Field(
+    sort_by: Optional[SortFieldT] = Field(default=None, description="Field to sort by")
+    sort_order: Literal["asc", "desc"] = Field(
         default="asc",
-        regex="^(asc|desc)$",
         description="Sort order: 'asc' or 'desc'"
     )
 
@@ -28,16 +83,75 @@ class PagedResponse(BaseModel, Generic[T]):
     """Generic paginated response wrapper."""
 
     items: list[T]
-    total: int = Field(description="Total number of items")
+    total: Optional[int] = Field(
+        default=None,
+        description="Total number of items; null on keyset (cursor) pages",
+    )
     skip: int = Field(description="Number of items skipped")
     limit: int = Field(description="Number of items in this page")
     has_more: bool = Field(description="Whether there are more items")
+    next_cursor: Optional[str] = Field(
+        default=None,
+        description="Cursor for the next page, when the endpoint supports keyset pagination",
+    )
+    total_is_estimate: bool = Field(
+        default=False,
+        description="Whether total is an approximate count",
+    )
 
     @property
     def page_number(self) -> int:
         """Calculate page number from skip and limit."""
         return (self.skip // self.limit) + 1
 
+    @classmethod
+    def to_orjson_response(
+        cls,
+        items: list[BaseModel],
+        total: Optional[int],
+        skip: int,
+        limit: int,
+        next_cursor: Optional[str] = None,
+        total_is_estimate: bool = False,
+        adapter: Optional[TypeAdapter] = None,
+        has_more: Optional[bool] = None,
+    ) -> ORJSONResponse:
+        """
+        Serialize a page of already-validated items straight to JSON.
+
+        Skips building and re-validating a PagedResponse (and FastAPI's
+        jsonable_encoder pass) for high-fanout list endpoints. Pass the
+        module-level ``TypeAdapter(list[Item])`` the items were validated
+        with as ``adapter`` to dump the whole page in one call. Pass
+        ``has_more`` when the caller knows it and total does not tell
+        (estimated totals); it is required when total is None (cursor
+        pages).
+
+        Raises:
+            ValueError: If both total and has_more are None
+        """
+        if has_more is None:
+            if total is None:
+                raise ValueError("has_more is required when total is None")
+            has_more = skip + len(items) < total
+
+        if adapter is not None:
+            dumped_items = adapter.dump_python(items, mode="json")
+        else:
+            dumped_items = [item.model_dump(mode="json") for item in items]
+
+        return ORJSONResponse(
+            content={
+                "items": dumped_items,
+                "total": total,
+                "skip": skip,
+                "limit": limit,
+                "has_more": has_more,
+                "next_cursor": next_cursor,
+                "total_is_estimate": total_is_estimate,
+            }
+        )
+
 
 class ErrorDetail(BaseModel):
     """Error detail with field and message."""
@@ -99,3 +213,23 @@ class MessageResponse(BaseModel):
     """Simple message response."""
 
     message: str = Field(description="Response message")
+
+    @classmethod
+    def as_response(cls, message: str, status_code: int = 200) -> Response:
+        """
+        Return a JSON response for ``message`` without building a model.
+
+        Messages are usually constant strings, so their serialized bytes
+        are memoized.
+        """
+        return Response(
+            content=_serialize_message(message),
+            status_code=status_code,
+            media_type="application/json",
+        )
+
+
+@lru_cache(maxsize=64)
+def _serialize_message(message: str) -> bytes:
+    """Serialize a MessageResponse payload (memoized per message)."""
+    return orjson.dumps({"message": message})
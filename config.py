@@ -4,8 +4,7 @@ Configuration module for Ticket Vendor API.
 Uses Pydantic Settings to load and validate environment variables.
 """
 
-from functools import lru_cache
-from typing import List
+from functools import cached_property
 
 from pydantic import Field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -29,21 +28,42 @@ class Settings(BaseSettings):
         ..., description="PostgreSQL database URL with asyncpg driver"
     )
     database_pool_size: int = Field(default=20)
-    database_max_overflow: int = Field(default=10)
+    database_max_overflow: int = Field(default=40)
+    database_pool_recycle_seconds: int = Field(default=3600)
+    database_pool_timeout_seconds: int = Field(default=5)
+    # Prepared statements kept per connection; set to 0 when connecting
+    # through PgBouncer in transaction pooling mode
+    database_statement_cache_size: int = Field(default=1024)
+    # list_events reports the planner's estimate above this many matches
+    event_count_estimate_threshold: int = Field(default=10_000)
+    event_count_estimate_ttl_seconds: int = Field(default=60)
 
     # Redis
     redis_url: str = Field(default="redis://localhost:6379/0")
     redis_ticket_hold_ttl: int = Field(default=300)  # 5 minutes
+    user_cache_enabled: bool = Field(default=True)
+    user_cache_ttl_seconds: int = Field(default=60)
+    event_cache_enabled: bool = Field(default=True)
+    event_cache_ttl_seconds: int = Field(default=300)
+    event_list_cache_ttl_seconds: int = Field(default=30)
+    view_count_buffer_enabled: bool = Field(default=True)
+    view_count_flush_interval_seconds: int = Field(default=30)
+    # Far above the slowest flush, so the lock never expires mid-flush
+    view_count_flush_lock_ttl_seconds: int = Field(default=300)
+    view_count_local_flush_interval_seconds: float = Field(default=0.5)
 
     # JWT Authentication
     secret_key: str = Field(..., description="Secret key for JWT encoding")
     algorithm: str = Field(default="HS256")
     access_token_expire_minutes: int = Field(default=15)
     refresh_token_expire_days: int = Field(default=7)
+    token_cache_enabled: bool = Field(default=False)
+    token_cache_maxsize: int = Field(default=10_000)
+    token_cache_ttl_seconds: int = Field(default=5)
 
     # CORS
-    cors_origins: List[str] = Field(
-        default=["http://localhost:3000", "http://localhost:8080"]
+    cors_origins: tuple[str, ...] = Field(
+        default=("http://localhost:3000", "http://localhost:8080")
     )
     cors_allow_credentials: bool = Field(default=True)
 
@@ -61,6 +81,8 @@ class Settings(BaseSettings):
     email_template_purchase_confirmation: str = Field(default="")
     email_template_waitlist_notification: str = Field(default="")
     email_template_ticket_reminder: str = Field(default="")
+    email_queue_maxsize: int = Field(default=10_000)
+    email_queue_batch_size: int = Field(default=100)
 
     # Rate Limiting
     rate_limit_per_minute: int = Field(default=60)
@@ -107,34 +129,46 @@ class Settings(BaseSettings):
     def parse_cors_origins(cls, v):
         """Parse CORS origins from comma-separated string or list."""
         if isinstance(v, str):
-            return [origin.strip() for origin in v.split(",")]
+            return tuple(origin.strip() for origin in v.split(","))
         return v
 
-    @property
+    @cached_property
     def database_url_sync(self) -> str:
         """Get synchronous database URL (for Alembic migrations)."""
         return self.database_url.replace("postgresql+asyncpg", "postgresql")
 
-    @property
+    @cached_property
+    def _environment_lower(self) -> str:
+        """Lowercased environment name, computed once."""
+        return self.environment.lower()
+
+    @cached_property
     def is_production(self) -> bool:
         """Check if running in production environment."""
-        return self.environment.lower() == "production"
+        return self._environment_lower == "production"
 
-    @property
+    @cached_property
     def is_development(self) -> bool:
         """Check if running in development environment."""
-        return self.environment.lower() == "development"
+        return self._environment_lower == "development"
+
+
+# Create the global settings instance once, at import
+settings = Settings()
 
 
-@lru_cache()
 def get_settings() -> Settings:
     """
-    Get cached settings instance.
-    
-    Uses lru_cache to ensure settings are loaded only once.
+    Get the application settings instance.
+
+    Kept for callers (e.g. FastAPI ``Depends``) that expect a provider
+    function; it simply returns the module-level ``settings``.
     """
-    return Settings()
+    return settings
 
 
-# Create a global settings instance
-settings = get_settings()
+def _reload_settings() -> Settings:
+    """Rebuild settings from the environment (for tests)."""
+    global settings
+    settings = Settings()
+    return settings
@@ -4,9 +4,12 @@ Database connection and session management.
 Provides async database engine, session factory, and dependency injection for FastAPI.
 """
 
-from typing import AsyncGenerator
+from functools import cache
+from importlib import import_module
+from typing import Any, AsyncGenerator
+from uuid import uuid4
 
-from sqlalchemy import event, pool
+import orjson
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
     AsyncSession,
@@ -20,15 +23,45 @@ from src.core.config import settings
 # Create declarative base for ORM models
 Base = declarative_base()
 
+
+def _json_serializer(value: Any) -> str:
+    """JSON/JSONB bind serializer (orjson; accepts non-str keys like json)."""
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+def _connect_args() -> dict[str, Any]:
+    """
+    asyncpg connection arguments for server-side prepared statements.
+
+    Hot queries are reused as prepared statements on each connection
+    (asyncpg's cache plus SQLAlchemy's asyncpg adapter cache), so Postgres
+    skips parse/plan on repeat executions. With the cache size set to 0
+    (PgBouncer transaction pooling) statements get unique names instead, as
+    consecutive statements may run on different server connections.
+    """
+    size = settings.database_statement_cache_size
+    connect_args: dict[str, Any] = {
+        "statement_cache_size": size,
+        "prepared_statement_cache_size": size,
+    }
+    if size == 0:
+        connect_args["prepared_statement_name_func"] = lambda: f"__asyncpg_{uuid4()}__"
+    return connect_args
+
+
 # Create async engine
 engine: AsyncEngine = create_async_engine(
     settings.database_url,
     echo=settings.debug,  # Log SQL queries in debug mode
-    poolclass=pool.QueuePool,
     pool_size=settings.database_pool_size,
     max_overflow=settings.database_max_overflow,
+    pool_timeout=settings.database_pool_timeout_seconds,  # Fail fast when exhausted
     pool_pre_ping=True,  # Verify connections before using
-    pool_recycle=3600,  # Recycle connections after 1 hour
+    pool_recycle=settings.database_pool_recycle_seconds,  # Recycle stale connections
+    pool_use_lifo=True,  # Reuse the most recently returned (warm) connection
+    json_serializer=_json_serializer,  # orjson for JSON/JSONB columns
+    json_deserializer=orjson.loads,
+    connect_args=_connect_args(),
 )
 
 # Create async session factory
@@ -41,6 +74,37 @@ async_session_maker = async_sessionmaker(
 )
 
 
+# Model modules that must be imported before mapper configuration / create_all.
+# Importing a single model (e.g. ``from src.models.users import User``) does
+# not pull in the rest; callers that need every mapper registered opt in via
+# ``register_all_models()``.
+MODEL_MODULES: tuple[str, ...] = (
+    "src.models.audit_log",
+    "src.models.email_notifications",
+    "src.models.events",
+    "src.models.orders",
+    "src.models.payment_transactions",
+    "src.models.promoters",
+    "src.models.ticket_tiers",
+    "src.models.tickets",
+    "src.models.users",
+    "src.models.waitlist",
+)
+
+
+@cache
+def register_all_models() -> None:
+    """
+    Import every model module so all mappers are registered on ``Base``.
+
+    Required before ``Base.metadata.create_all`` and by Alembic's env.py so
+    relationship strings can be resolved. Memoized, so repeated calls (e.g.
+    ``init_db`` per test class) return immediately.
+    """
+    for module_name in MODEL_MODULES:
+        import_module(module_name)
+
+
 # Dependency for FastAPI endpoints
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """
@@ -60,7 +124,10 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
     async with async_session_maker() as session:
         try:
             yield session
-            await session.commit()
+            # Services commit their own writes; only flush leftovers so
+            # read-only requests don't pay for a COMMIT round-trip.
+            if session.new or session.dirty or session.deleted:
+                await session.commit()
         except Exception:
             await session.rollback()
             raise
@@ -68,6 +135,23 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
             await session.close()
 
 
+def pool_status() -> dict[str, int | str]:
+    """
+    Snapshot of the engine's connection pool counters.
+
+    Used by the debug endpoint to size ``database_pool_size`` /
+    ``database_max_overflow`` under load.
+    """
+    pool = engine.pool
+    return {
+        "size": pool.size(),
+        "checked_in": pool.checkedin(),
+        "checked_out": pool.checkedout(),
+        "overflow": pool.overflow(),
+        "status": pool.status(),
+    }
+
+
 async def init_db() -> None:
     """
     Initialize database tables.
@@ -75,21 +159,10 @@ async def init_db() -> None:
     Creates all tables defined in SQLAlchemy models.
     Should only be used in development. Use Alembic migrations in production.
     """
-    async with engine.begin() as conn:
-        # Import all models here to ensure they're registered
-        from src.models import (  # noqa: F401
-            audit_log,
-            email_notifications,
-            events,
-            orders,
-            payment_transactions,
-            promoters,
-            ticket_tiers,
-            tickets,
-            users,
-            waitlist,
-        )
+    # Ensure every model is registered before creating tables
+    register_all_models()
 
+    async with engine.begin() as conn:
         # Create all tables
         await conn.run_sync(Base.metadata.create_all)
 
@@ -98,15 +171,3 @@ async def close_db() -> None:
     """Close database connections."""
     await engine.dispose()
 
-
-# Event listeners for debugging (optional)
-if settings.debug:
-
-    @event.listens_for(engine.sync_engine, "before_cursor_execute")
-    def receive_before_cursor_execute(conn, cursor, statement, params, context, executemany):
-        """Log SQL queries in debug mode."""
-        if settings.debug:
-            print(f"\n--- SQL Query ---")
-            print(statement)
-            if params:
-                print(f"Parameters: {params}")
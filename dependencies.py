@@ -8,30 +8,91 @@ Provides dependency functions that can be used in route handlers:
 - get_optional_user: Get user if authenticated, None otherwise
 """
 
+import logging
 from typing import Optional
-from fastapi import Depends, HTTPException, status
-from fastapi.security import HTTPBearer, HTTPAuthCredentials
+from fastapi import Depends, Header, HTTPException, status
+from fastapi.security import HTTPBearer
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
 from sqlalchemy.orm import selectinload
 
 from src.core.database import get_db
 from src.core.security import verify_token
+from src.core.user_cache import cache_user, get_cached_user
 from src.models.users import User, UserRole
 from src.models.promoters import Promoter
 
-# HTTP Bearer security scheme for Swagger documentation
+logger = logging.getLogger(__name__)
+
+# HTTP Bearer security scheme for Swagger documentation only. Request-time
+# token extraction uses the lightweight header parsers below; add
+# ``dependencies=[Depends(security)]`` to a router to show the lock icon.
 security = HTTPBearer(
-    description="JWT Bearer token authentication"
+    description="JWT Bearer token authentication",
+    auto_error=False,
 )
 
 
+# ============================================================================
+# Bearer Token Extraction
+# ============================================================================
+
+def _parse_bearer(authorization: Optional[str]) -> Optional[str]:
+    """Return the token from an ``Authorization: Bearer <token>`` header."""
+    if not authorization:
+        return None
+    scheme, _, token = authorization.partition(" ")
+    if not token or scheme.lower() != "bearer":
+        return None
+    return token
+
+
+async def get_bearer_token(
+    authorization: Optional[str] = Header(default=None)
+) -> str:
+    """
+    Extract the bearer token from the Authorization header.
+    
+    Raises:
+        HTTPException: 401 if the header is missing or not a Bearer token
+    """
+    token = _parse_bearer(authorization)
+    if token is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Not authenticated",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    return token
+
+
+async def get_optional_bearer_token(
+    authorization: Optional[str] = Header(default=None)
+) -> Optional[str]:
+    """Extract the bearer token if present, None otherwise."""
+    return _parse_bearer(authorization)
+
+
 # ============================================================================
 # Current User Dependencies
 # ============================================================================
 
+async def _load_user(db: AsyncSession, user_id: int) -> Optional[User]:
+    """Load a user with its promoter, serving from the user cache when possible."""
+    user = await get_cached_user(db, user_id)
+    if user is not None:
+        return user
+    
+    # Session.get() returns straight from the identity map when this
+    # request's session already holds the user
+    user = await db.get(User, user_id, options=[selectinload(User.promoter)])
+    if user is not None:
+        await cache_user(user)
+    return user
+
+
 async def get_current_user(
-    credentials: HTTPAuthCredentials = Depends(security),
+    token: str = Depends(get_bearer_token),
     db: AsyncSession = Depends(get_db)
 ) -> User:
     """
@@ -41,7 +102,7 @@ async def get_current_user(
     verifies it, and returns the corresponding User model from the database.
     
     Args:
-        credentials: HTTPAuthCredentials from Authorization header
+        token: Bearer token from Authorization header
         db: Database session
         
     Returns:
@@ -50,8 +111,6 @@ async def get_current_user(
     Raises:
         HTTPException: 401 if token is invalid or user not found
     """
-    token = credentials.credentials
-    
     # Verify token
     token_payload = verify_token(token)
     if token_payload is None:
@@ -69,13 +128,8 @@ async def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
     
-    # Get user from database with promoter relationship
-    result = await db.execute(
-        select(User)
-        .where(User.id == int(token_payload.sub))
-        .options(selectinload(User.promoter))
-    )
-    user = result.scalars().first()
+    # Get user (with promoter relationship) from cache or database
+    user = await _load_user(db, token_payload.sub)
     
     if user is None:
         raise HTTPException(
@@ -158,7 +212,7 @@ async def get_current_promoter_user(
 
 async def get_optional_user(
     db: AsyncSession = Depends(get_db),
-    credentials: Optional[HTTPAuthCredentials] = Depends(security)
+    token: Optional[str] = Depends(get_optional_bearer_token)
 ) -> Optional[User]:
     """
     Get the current user if authenticated, None otherwise.
@@ -168,35 +222,31 @@ async def get_optional_user(
     
     Args:
         db: Database session
-        credentials: Optional HTTPAuthCredentials from Authorization header
+        token: Optional bearer token from Authorization header
         
     Returns:
         User object if token is valid, None otherwise
     """
-    if credentials is None:
+    if token is None:
+        return None
+    
+    # Bad, expired or non-access tokens never reach the database
+    token_payload = verify_token(token)
+    if token_payload is None or token_payload.type != "access":
         return None
     
     try:
-        token = credentials.credentials
-        token_payload = verify_token(token)
-        
-        if token_payload is None or token_payload.type != "access":
-            return None
-        
-        result = await db.execute(
-            select(User)
-            .where(User.id == int(token_payload.sub))
-            .options(selectinload(User.promoter))
-        )
-        user = result.scalars().first()
-        
-        if user is None or user.deleted_at is not None:
-            return None
-        
-        return user
-    except Exception:
-        # If any error occurs, just return None (don't fail the request)
+        user = await _load_user(db, token_payload.sub)
+    except SQLAlchemyError:
+        # Don't fail an endpoint that works anonymously, but don't hide it
+        logger.warning("Optional user lookup failed", exc_info=True)
+        await db.rollback()
         return None
+    
+    if user is None or user.deleted_at is not None:
+        return None
+    
+    return user
 
 
 # ============================================================================
@@ -204,13 +254,13 @@ async def get_optional_user(
 # ============================================================================
 
 async def get_refresh_token(
-    credentials: HTTPAuthCredentials = Depends(security)
+    token: str = Depends(get_bearer_token)
 ) -> str:
     """
     Extract and validate refresh token from Authorization header.
     
     Args:
-        credentials: HTTPAuthCredentials from Authorization header
+        token: Bearer token from Authorization header
         
     Returns:
         Refresh token string if valid
@@ -218,8 +268,6 @@ async def get_refresh_token(
     Raises:
         HTTPException: 401 if token is invalid or wrong type
     """
-    token = credentials.credentials
-    
     # Verify token
     token_payload = verify_token(token)
     if token_payload is None:
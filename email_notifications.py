@@ -52,8 +52,12 @@ class EmailNotification(Base):
     # Error Information
     error_message: Mapped[str | None] = mapped_column(Text)
 
-    # Metadata
-    metadata: Mapped[dict] = mapped_column(JSONB, default={})
+    # Metadata (``metadata`` is reserved by the declarative base, so the
+    # attribute is renamed while the column keeps its name). Deferred like
+    # the audit log blobs; opt in with .options(undefer(...))
+    extra_metadata: Mapped[dict] = mapped_column(
+        "metadata", JSONB, default=dict, deferred=True
+    )
 
     # Timestamp
     created_at: Mapped[datetime] = mapped_column(
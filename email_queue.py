@@ -0,0 +1,106 @@
+"""
+In-process queue for outgoing email notifications.
+
+Request handlers call ``enqueue_email()``, which only puts the job on an
+asyncio queue and returns. A background worker (started in the app
+lifespan) drains the queue in batches and records the EmailNotification
+rows with its own session, so neither the insert nor delivery sits on the
+request path. Delivery (SendGrid) plugs into ``_process_batch``.
+"""
+
+import asyncio
+import logging
+from typing import Any, Optional
+
+from src.core.config import settings
+from src.core.database import async_session_maker
+from src.services.email_service import EmailNotificationService
+
+logger = logging.getLogger(__name__)
+
+_queue: Optional[asyncio.Queue] = None
+_worker: Optional[asyncio.Task] = None
+
+
+def _get_queue() -> asyncio.Queue:
+    global _queue
+    if _queue is None:
+        _queue = asyncio.Queue(maxsize=settings.email_queue_maxsize)
+    return _queue
+
+
+def enqueue_email(
+    email: str,
+    template_name: str,
+    subject: str,
+    user_id: Optional[int] = None,
+    metadata: Optional[dict[str, Any]] = None,
+) -> None:
+    """
+    Queue an email notification (fire-and-forget).
+
+    Never blocks the caller; if the queue is full the email is dropped and
+    a warning is logged.
+    """
+    job = {
+        "email": email,
+        "template_name": template_name,
+        "subject": subject,
+        "user_id": user_id,
+        "extra_metadata": metadata or {},
+    }
+    try:
+        _get_queue().put_nowait(job)
+    except asyncio.QueueFull:
+        logger.warning("Email queue full, dropping %s email to %s", template_name, email)
+
+
+async def _process_batch(jobs: list[dict[str, Any]]) -> None:
+    """Record a batch of queued emails as pending notifications."""
+    async with async_session_maker() as session:
+        await EmailNotificationService(session).bulk_create(jobs)
+
+
+async def _run_worker() -> None:
+    queue = _get_queue()
+    while True:
+        jobs = [await queue.get()]
+        while len(jobs) < settings.email_queue_batch_size:
+            try:
+                jobs.append(queue.get_nowait())
+            except asyncio.QueueEmpty:
+                break
+
+        try:
+            await _process_batch(jobs)
+        except Exception:
+            logger.exception("Failed to record %d email notifications", len(jobs))
+        finally:
+            for _ in jobs:
+                queue.task_done()
+
+
+def start_email_worker() -> None:
+    """Start the background worker (call once at startup)."""
+    global _worker
+    if _worker is None:
+        _worker = asyncio.create_task(_run_worker())
+
+
+async def stop_email_worker(timeout: float = 5.0) -> None:
+    """Flush queued emails (up to ``timeout`` seconds) and stop the worker."""
+    global _worker
+    if _worker is None:
+        return
+
+    try:
+        await asyncio.wait_for(_get_queue().join(), timeout)
+    except asyncio.TimeoutError:
+        logger.warning("Email queue not drained before shutdown")
+
+    _worker.cancel()
+    try:
+        await _worker
+    except asyncio.CancelledError:
+        pass
+    _worker = None
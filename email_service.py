@@ -0,0 +1,44 @@
+"""
+Email Notification Service - Persistence for email notification records.
+
+Handles:
+- Bulk creation of notification rows (broadcasts, queued emails)
+"""
+
+from typing import Any
+
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.models.email_notifications import EmailNotification
+
+# Rows per INSERT statement; keeps bind parameter counts well under
+# PostgreSQL's 32767 limit
+_BULK_CHUNK_SIZE = 1000
+
+
+class EmailNotificationService:
+    """Service for email notification records."""
+
+    def __init__(self, db: AsyncSession):
+        """Initialize service with database session."""
+        self.db = db
+
+    async def bulk_create(self, rows: list[dict[str, Any]]) -> None:
+        """
+        Insert many notifications with multi-row INSERTs.
+
+        Args:
+            rows: Column values keyed by EmailNotification attribute name
+                (e.g. ``email``, ``template_name``, ``subject``,
+                ``extra_metadata``); every row must have the same keys
+        """
+        if not rows:
+            return
+
+        for start in range(0, len(rows), _BULK_CHUNK_SIZE):
+            await self.db.execute(
+                insert(EmailNotification),
+                rows[start:start + _BULK_CHUNK_SIZE],
+            )
+        await self.db.commit()
@@ -0,0 +1,14 @@
+"""
+Enumerations shared by models and schemas.
+"""
+
+import enum
+
+
+class PaymentStatus(str, enum.Enum):
+    """Payment status enumeration."""
+
+    PENDING = "pending"
+    COMPLETED = "completed"
+    FAILED = "failed"
+    REFUNDED = "refunded"
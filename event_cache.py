@@ -0,0 +1,165 @@
+"""
+Redis cache of public event payloads.
+
+Stores the serialized EventDetailResponse of published events under
+``event:detail:{id}:v{version}``, and serialized GET /events pages under
+``events:list:{version}:{digest of the query parameters}``, each for a
+short TTL. EventService and TicketService call ``invalidate_event()``
+after writing an event or its tiers; that bumps the event's version and
+the list version, so stale entries are never read again (they expire on
+their own). Keys are resolved before the database is read, so a payload
+built while a write commits is stored under the old, abandoned version.
+Redis errors fall back to the database.
+"""
+
+import asyncio
+import hashlib
+from typing import Any, Optional
+
+from redis.exceptions import RedisError
+
+from src.core.cache import get_redis
+from src.core.config import settings
+
+
+_LIST_VERSION_KEY = "events:list:version"
+
+# How long a request that lost the fill race waits for the winner
+_FILL_WAIT_SECONDS = 0.05
+_FILL_WAIT_ATTEMPTS = 3
+
+
+def _version_key(event_id: int) -> str:
+    return f"event:ver:{event_id}"
+
+
+def _fill_lock_key(event_id: int) -> str:
+    return f"event:detail:lock:{event_id}"
+
+
+async def event_detail_key(event_id: int) -> Optional[str]:
+    """
+    Cache key for an event's detail payload under its current version.
+
+    Returns:
+        Key, or None if caching is disabled or Redis failed
+    """
+    if not settings.event_cache_enabled:
+        return None
+
+    try:
+        version = await get_redis().get(_version_key(event_id))
+    except RedisError:
+        return None
+
+    return f"event:detail:{event_id}:v{int(version or 0)}"
+
+
+async def get_cached_event(key: str) -> Optional[bytes]:
+    """Get a serialized event detail payload (None on a miss or error)."""
+    try:
+        return await get_redis().get(key)
+    except RedisError:
+        return None
+
+
+async def claim_event_fill(event_id: int) -> bool:
+    """
+    Claim the right to rebuild an event's cached payload.
+
+    Only one request per event rebuilds after a miss; the others call
+    ``wait_for_cached_event()`` instead of all hitting the database.
+
+    Returns:
+        True if claimed (or Redis failed), False if another request has it
+    """
+    try:
+        claimed = await get_redis().set(_fill_lock_key(event_id), 1, nx=True, ex=5)
+    except RedisError:
+        return True
+    return bool(claimed)
+
+
+async def wait_for_cached_event(key: str) -> Optional[bytes]:
+    """Briefly poll for a payload another request is filling."""
+    for _ in range(_FILL_WAIT_ATTEMPTS):
+        await asyncio.sleep(_FILL_WAIT_SECONDS)
+        payload = await get_cached_event(key)
+        if payload is not None:
+            return payload
+    return None
+
+
+async def cache_event(event_id: int, key: str, payload: Optional[bytes]) -> None:
+    """
+    Store a serialized event detail payload and release the fill claim.
+
+    Pass ``payload=None`` to only release the claim (e.g. for events that
+    are not cached because they aren't published).
+    """
+    try:
+        async with get_redis().pipeline(transaction=False) as pipe:
+            if payload is not None:
+                pipe.set(key, payload, ex=settings.event_cache_ttl_seconds)
+            pipe.delete(_fill_lock_key(event_id))
+            await pipe.execute()
+    except RedisError:
+        pass
+
+
+async def invalidate_event(event_id: int) -> None:
+    """
+    Invalidate a cached event and all cached event lists.
+
+    Call after an event (or one of its tiers) is created, changed or deleted.
+    """
+    if not settings.event_cache_enabled:
+        return
+
+    try:
+        async with get_redis().pipeline(transaction=False) as pipe:
+            pipe.incr(_version_key(event_id))
+            pipe.incr(_LIST_VERSION_KEY)
+            await pipe.execute()
+    except RedisError:
+        pass
+
+
+async def event_list_key(params: tuple[Any, ...]) -> Optional[str]:
+    """
+    Cache key for an event list query under the current list version.
+
+    Args:
+        params: Every query parameter that affects the page
+
+    Returns:
+        Key, or None if caching is disabled or Redis failed
+    """
+    if not settings.event_cache_enabled:
+        return None
+
+    try:
+        version = await get_redis().get(_LIST_VERSION_KEY)
+    except RedisError:
+        return None
+
+    digest = hashlib.blake2b(repr(params).encode(), digest_size=16).hexdigest()
+    return f"events:list:{int(version or 0)}:{digest}"
+
+
+async def get_cached_event_list(key: str) -> Optional[bytes]:
+    """Get a serialized event list page (None on a miss or error)."""
+    try:
+        return await get_redis().get(key)
+    except RedisError:
+        return None
+
+
+async def cache_event_list(key: str, payload: bytes) -> None:
+    """Store a serialized event list page."""
+    try:
+        await get_redis().set(
+            key, payload, ex=settings.event_list_cache_ttl_seconds
+        )
+    except RedisError:
+        pass
@@ -9,15 +9,42 @@ Handles:
 - Soft delete support
 """
 
+import base64
+import re
+import secrets
 from datetime import datetime, timezone
-from typing import Optional
-from sqlalchemy import select, and_, or_, func
+from typing import Literal, NamedTuple, Optional
+
+from cachetools import TTLCache
+from sqlalchemy import (
+    Boolean,
+    Integer,
+    column,
+    values,
+    select,
+    update,
+    exists,
+    and_,
+    or_,
+    func,
+    bindparam,
+    literal_column,
+    text,
+    tuple_,
+    lambda_stmt,
+)
+from sqlalchemy.sql.lambdas import StatementLambdaElement
+from sqlalchemy.dialects.postgresql import TSVECTOR, insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import InstrumentedAttribute, joinedload, raiseload, selectinload
+from sqlalchemy.orm.attributes import set_committed_value
 from fastapi import HTTPException, status
 
+from src.core.config import settings
+from src.core.event_cache import invalidate_event
 from src.models.events import Event, EventStatus
 from src.models.promoters import Promoter
+from src.models.tickets import Ticket
 from src.models.users import User, UserRole
 from src.schemas.events import (
     EventCreate,
@@ -27,6 +54,159 @@ from src.schemas.events import (
 )
 
 
+# Columns events may be sorted by; each is backed by an index.
+# "relevance" ranks full-text matches and requires a search term.
+EventSortField = Literal["start_time", "published_at", "relevance"]
+
+_SORTABLE_COLUMNS: dict[str, InstrumentedAttribute] = {
+    "start_time": Event.start_time,
+    "published_at": Event.published_at,
+}
+
+# Published/cancelled events only accept these (cosmetic) updates
+_UPDATE_LOCKED_STATUSES = frozenset({EventStatus.PUBLISHED, EventStatus.CANCELLED})
+_ALLOWED_LOCKED_UPDATE_FIELDS = frozenset(
+    {"description", "featured_image_url", "banner_image_url"}
+)
+
+# Keyset pagination cursors are only issued for this sort (start_time is
+# NOT NULL and, with id as tie-breaker, gives a total order)
+_CURSOR_SORT_FIELD = "start_time"
+
+# Generated column over title, description, venue name and city (see
+# schema.sql); it is database-maintained, so it is not mapped on Event
+_SEARCH_VECTOR = literal_column("events.search_vector", type_=TSVECTOR)
+
+# Planner statistics for the events table: its row estimate and the status
+# column's value frequencies (reltuples is -1 until the first ANALYZE)
+_EVENT_STATS_STMT = text(
+    """
+    SELECT c.reltuples::bigint AS reltuples,
+           s.most_common_vals::text::text[] AS status_values,
+           s.most_common_freqs AS status_freqs
+    FROM pg_class c
+    JOIN pg_namespace n ON n.oid = c.relnamespace
+    LEFT JOIN pg_stats s
+      ON s.schemaname = n.nspname AND s.tablename = c.relname AND s.attname = 'status'
+    WHERE c.oid = 'events'::regclass
+    """
+)
+
+# (row estimate, {status: frequency}), re-read at most once per TTL rather
+# than on every listing
+_event_stats_cache: TTLCache = TTLCache(
+    maxsize=1, ttl=settings.event_count_estimate_ttl_seconds
+)
+
+
+# Hot lookups are built once at import with bound parameters, so every call
+# reuses the same statement (and its compiled-cache entry) instead of
+# rebuilding it with conditional where/options chains
+# Everything EventDetailResponse serializes is loaded up front (promoter
+# and user joined, tiers in one IN query); in debug mode any other lazy
+# load raises so a new N+1 shows up immediately
+_GET_EVENT_STMT = (
+    select(Event)
+    .where(Event.id == bindparam("event_id"))
+    .where(or_(bindparam("include_deleted", type_=Boolean), Event.deleted_at.is_(None)))
+    .options(
+        joinedload(Event.promoter).joinedload(Promoter.user),
+        selectinload(Event.ticket_tiers),
+        *([raiseload("*")] if settings.debug else []),
+    )
+)
+
+_EVENT_FOR_WRITE_STMT = (
+    select(Event, User)
+    .where(Event.id == bindparam("event_id"))
+    .where(Event.deleted_at.is_(None))
+    .where(User.id == bindparam("user_id"))
+    .options(
+        joinedload(Event.promoter).joinedload(Promoter.user),
+        selectinload(Event.ticket_tiers),
+    )
+)
+
+# Soft delete with delete_event's checks folded into the WHERE clause: the
+# user owns the event through its promoter (or is an admin), and a
+# published event has no sold tickets
+_SOFT_DELETE_STMT = (
+    update(Event)
+    .where(Event.id == bindparam("event_id"))
+    .where(Event.deleted_at.is_(None))
+    .where(
+        or_(
+            exists().where(
+                Promoter.id == Event.promoter_id,
+                Promoter.user_id == bindparam("user_id"),
+            ),
+            exists().where(
+                User.id == bindparam("user_id"),
+                User.role == UserRole.ADMIN,
+            ),
+        )
+    )
+    .where(
+        or_(
+            Event.status != EventStatus.PUBLISHED,
+            ~exists().where(Ticket.event_id == Event.id),
+        )
+    )
+    .values(deleted_at=bindparam("now"), status=EventStatus.CANCELLED)
+    .returning(Event.id)
+    .execution_options(synchronize_session=False)
+)
+
+_VERIFIED_PROMOTER_STMT = (
+    select(Promoter)
+    .where(Promoter.id == bindparam("promoter_id"))
+    .options(joinedload(Promoter.user))
+)
+
+
+# URL slugs: lowercase alphanumerics joined by single hyphens, short enough
+# to take a collision suffix within VARCHAR(255)
+_SLUG_SEPARATORS = re.compile(r"[^a-z0-9]+")
+_SLUG_MAX_LENGTH = 200
+# Inserts tried (the title's slug, then random suffixes) before giving up
+_SLUG_ATTEMPTS = 5
+
+
+def _slugify(title: str) -> str:
+    """URL slug for an event title (falls back to "event")."""
+    slug = _SLUG_SEPARATORS.sub("-", title.lower()).strip("-")
+    return slug[:_SLUG_MAX_LENGTH].rstrip("-") or "event"
+
+
+def _encode_cursor(event: Event) -> str:
+    """Opaque cursor pointing just past ``event`` in start_time order."""
+    raw = f"{event.start_time.isoformat()}:{event.id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def _decode_cursor(cursor: str) -> tuple[datetime, int]:
+    """Decode a cursor into (start_time, id); 400 if malformed."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode()).decode()
+        start_time, event_id = raw.rsplit(":", 1)
+        return datetime.fromisoformat(start_time), int(event_id)
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid pagination cursor"
+        )
+
+
+class EventPage(NamedTuple):
+    """A page of events from EventService.list_events."""
+
+    events: list[Event]
+    total: Optional[int]
+    has_more: bool
+    next_cursor: Optional[str]
+    total_is_estimate: bool
+
+
 class EventService:
     """Service for event management operations."""
 
@@ -54,18 +234,13 @@ class EventService:
             Created event
 
         Raises:
-            HTTPException: If promoter not found or not verified
+            HTTPException: If promoter not found or not verified, or no
+                unique slug could be allocated
         """
         # Verify promoter exists and is verified
-        promoter = await self._get_promoter(promoter_id)
-        if not promoter.is_verified:
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="Promoter account must be verified to create events"
-            )
+        promoter = await self._get_verified_promoter(promoter_id)
 
-        # Create event instance
-        event = Event(
+        values = dict(
             promoter_id=promoter_id,
             title=event_data.title,
             description=event_data.description,
@@ -90,12 +265,37 @@ class EventService:
             status=EventStatus.DRAFT,  # New events start as draft
         )
 
-        self.db.add(event)
-        await self.db.commit()
-        await self.db.refresh(event)
+        # INSERT ... ON CONFLICT (slug) DO NOTHING RETURNING: a free slug
+        # costs one round trip and the complete row (id and server-generated
+        # columns) comes back with it; a taken slug returns no row and is
+        # retried with a random suffix. Unique-index arbitration makes this
+        # safe under concurrent creates without a pre-check SELECT.
+        base_slug = _slugify(event_data.title)
+        slug = base_slug
+        for _ in range(_SLUG_ATTEMPTS):
+            result = await self.db.execute(
+                pg_insert(Event)
+                .values(**values, slug=slug)
+                .on_conflict_do_nothing(index_elements=[Event.slug])
+                .returning(Event)
+            )
+            event = result.scalar_one_or_none()
+            if event is not None:
+                break
+            slug = f"{base_slug}-{secrets.token_hex(3)}"
+        else:
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="Could not allocate a unique slug for this event"
+            )
 
-        # Load relationships
-        await self.db.refresh(event, ["promoter"])
+        # The promoter came with the verification query and a new event
+        # has no tiers, so nothing has to be re-selected for the response
+        set_committed_value(event, "promoter", promoter)
+        set_committed_value(event, "ticket_tiers", [])
+
+        await self.db.commit()
+        await invalidate_event(event.id)
 
         return event
 
@@ -117,18 +317,10 @@ class EventService:
         Raises:
             HTTPException: If event not found
         """
-        query = select(Event).where(Event.id == event_id)
-        
-        if not include_deleted:
-            query = query.where(Event.deleted_at.is_(None))
-
-        # Load relationships
-        query = query.options(
-            selectinload(Event.promoter).selectinload(Promoter.user),
-            selectinload(Event.ticket_tiers)
+        result = await self.db.execute(
+            _GET_EVENT_STMT,
+            {"event_id": event_id, "include_deleted": include_deleted},
         )
-
-        result = await self.db.execute(query)
         event = result.scalar_one_or_none()
 
         if not event:
@@ -149,7 +341,11 @@ class EventService:
         is_featured: Optional[bool] = None,
         search: Optional[str] = None,
         include_past: bool = False,
-    ) -> tuple[list[Event], int]:
+        sort_by: EventSortField = "start_time",
+        sort_order: Literal["asc", "desc"] = "desc",
+        load_tiers: bool = False,
+        cursor: Optional[str] = None,
+    ) -> EventPage:
         """
         List events with filters and pagination.
 
@@ -160,62 +356,191 @@ class EventService:
             promoter_id: Filter by promoter
             category: Filter by category
             is_featured: Filter by featured status
-            search: Search in title and description
+            search: Full-text search in title, description, venue and city
             include_past: Include past events
+            sort_by: Column to order by, or "relevance" (see EventSortField)
+            sort_order: "asc" or "desc"
+            load_tiers: Also eager-load ticket tiers (not needed for summaries)
+            cursor: Keyset cursor from a previous page (start_time sort only,
+                not with skip); cursor pages are not counted
 
         Returns:
-            Tuple of (events list, total count)
+            EventPage of (events, total, has_more, next_cursor,
+            total_is_estimate); total is None for cursor pages and the
+            planner's estimate for large unfiltered listings
+
+        Raises:
+            HTTPException: If cursor is malformed, or used with skip or
+                another sort
         """
-        # Build base query
-        query = select(Event).where(Event.deleted_at.is_(None))
+        if not search and sort_by == "relevance":
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="sort_by=relevance requires a search term"
+            )
+
+        # The query is assembled from lambdas so SQLAlchemy caches each
+        # combination of filters by the lambdas' code objects and only
+        # extracts the per-call values (the closure variables) as bound
+        # parameters, instead of rebuilding and re-keying the whole
+        # statement on every request
+        query = lambda_stmt(lambda: select(Event).where(Event.deleted_at.is_(None)))
 
         # Apply filters
         if status_filter:
-            query = query.where(Event.status == status_filter)
+            # Rendered as a literal rather than a bound parameter so the
+            # planner can match the status = 'published' partial indexes even
+            # under a generic prepared-statement plan (one cache entry each)
+            status_criterion = Event.status == bindparam(
+                "status_filter", status_filter, literal_execute=True
+            )
+            query = query.add_criteria(
+                lambda s: s.where(status_criterion), track_on=[status_filter]
+            )
 
         if promoter_id:
-            query = query.where(Event.promoter_id == promoter_id)
+            query += lambda s: s.where(Event.promoter_id == promoter_id)
 
         if category:
-            query = query.where(Event.category == category)
+            query += lambda s: s.where(Event.category == category)
 
         if is_featured is not None:
-            query = query.where(Event.is_featured == is_featured)
+            query += lambda s: s.where(Event.is_featured == is_featured)
 
         if not include_past:
-            query = query.where(Event.end_time > datetime.now(timezone.utc))
+            # Database clock, so the bound isn't a per-request Python value
+            query += lambda s: s.where(Event.end_time > func.now())
 
         if search:
-            search_term = f"%{search}%"
-            query = query.where(
-                or_(
-                    Event.title.ilike(search_term),
-                    Event.description.ilike(search_term),
-                    Event.venue_name.ilike(search_term),
-                    Event.venue_city.ilike(search_term)
-                )
+            # Full-text match against the generated, GIN-indexed search_vector
+            query += lambda s: s.where(
+                _SEARCH_VECTOR.op("@@")(func.plainto_tsquery("english", search))
             )
 
-        # Get total count
-        count_query = select(func.count()).select_from(query.subquery())
-        total = await self.db.scalar(count_query)
+        if cursor:
+            if skip:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail="skip cannot be combined with cursor"
+                )
+            if sort_by != _CURSOR_SORT_FIELD:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=f"Cursor pagination requires sort_by={_CURSOR_SORT_FIELD}"
+                )
+            cursor_start, cursor_id = _decode_cursor(cursor)
+            if sort_order == "desc":
+                query += lambda s: s.where(
+                    tuple_(Event.start_time, Event.id) < tuple_(cursor_start, cursor_id)
+                )
+            else:
+                query += lambda s: s.where(
+                    tuple_(Event.start_time, Event.id) > tuple_(cursor_start, cursor_id)
+                )
 
-        # Apply pagination and ordering
-        query = (
-            query
-            .options(
-                selectinload(Event.promoter).selectinload(Promoter.user),
-                selectinload(Event.ticket_tiers)
+        # Ordering: id breaks start_time ties so keyset pages never skip or
+        # repeat rows
+        if sort_by == "relevance":
+            # Named bind, supplied at execute time, so the cached ordering
+            # never carries a previous request's search term
+            sort_column = func.ts_rank(
+                _SEARCH_VECTOR, func.plainto_tsquery("english", bindparam("rank_search"))
             )
-            .order_by(Event.start_time.desc())
-            .offset(skip)
-            .limit(limit)
-        )
+        else:
+            sort_column = _SORTABLE_COLUMNS[sort_by]
+        if sort_order == "desc":
+            order_by = (sort_column.desc(), Event.id.desc())
+        else:
+            order_by = (sort_column.asc(), Event.id.asc())
+        # Promoter and its user are single objects: join them in
+        loader_options = [joinedload(Event.promoter).joinedload(Promoter.user)]
+        if load_tiers:
+            loader_options.append(selectinload(Event.ticket_tiers))
+        if settings.debug:
+            # Surface accidental lazy loads during development
+            loader_options.append(raiseload("*"))
+
+        def paginate(
+            stmt: StatementLambdaElement, page_size: int = limit
+        ) -> StatementLambdaElement:
+            # Ordering and loader options hold no per-call values; they are
+            # keyed on the choices that shape them
+            stmt = stmt.add_criteria(
+                lambda s: s.options(*loader_options).order_by(*order_by),
+                track_on=[sort_by, sort_order, load_tiers],
+            )
+            return stmt + (lambda s: s.offset(skip).limit(page_size))
 
-        result = await self.db.execute(query)
-        events = list(result.scalars().all())
+        count_query = query + (
+            lambda s: s.with_only_columns(func.count(), maintain_column_froms=True)
+        )
 
-        return events, total or 0
+        # Only the status filter narrows the table: the cached table-size
+        # estimate says whether counting every match would be expensive.
+        # Upcoming-only listings (the default) are never estimated: the
+        # table estimate is mostly past events there, and counting the few
+        # upcoming matches is cheap.
+        estimate = None
+        if include_past and not (
+            cursor or promoter_id or category or search or is_featured is not None
+        ):
+            estimate = await self._estimate_count(status_filter)
+            if estimate < settings.event_count_estimate_threshold:
+                estimate = None
+
+        estimated_total = None
+        if cursor:
+            # Keyset page: no total, so the scan stops after limit + 1 rows
+            # (the extra row only tells whether another page exists)
+            result = await self.db.execute(paginate(query, limit + 1))
+            events = list(result.scalars().all())
+            has_more = len(events) > limit
+            events = events[:limit]
+            total = None
+        elif estimate is not None and skip + limit < estimate:
+            # Large listing, page well before the end: report the estimate
+            # instead of counting every match
+            result = await self.db.execute(paginate(query, limit + 1))
+            events = list(result.scalars().all())
+            has_more = len(events) > limit
+            events = events[:limit]
+            if events and not has_more:
+                # The estimate overshot and this is the last page
+                total = skip + len(events)
+            elif events:
+                estimated_total = total = estimate
+            else:
+                # Page is past the end; count the matches separately
+                total = await self.db.scalar(count_query)
+        else:
+            # Exact total from a window function in the same query
+            page_query = query + (
+                lambda s: s.add_columns(func.count().over().label("total"))
+            )
+            result = await self.db.execute(
+                paginate(page_query),
+                {"rank_search": search} if sort_by == "relevance" else None,
+            )
+            rows = result.all()
+            if rows:
+                total = rows[0].total
+            elif skip > 0:
+                # Page is past the end; count the matches separately
+                total = await self.db.scalar(count_query)
+            else:
+                total = 0
+
+            events = [row.Event for row in rows]
+            total = total or 0
+            has_more = skip + len(events) < total
+
+        next_cursor = None
+        if sort_by == _CURSOR_SORT_FIELD and has_more:
+            next_cursor = _encode_cursor(events[-1])
+
+        return EventPage(
+            events, total, has_more, next_cursor, estimated_total is not None
+        )
 
     async def update_event(
         self,
@@ -238,30 +563,28 @@ class EventService:
             HTTPException: If unauthorized or event not found
         """
         # Get event and check permissions
-        event = await self.get_event(event_id)
-        await self._check_event_permission(event, user_id)
+        event = await self._load_event_for_write(event_id, user_id)
+
+        update_dict = event_data.model_dump(exclude_unset=True)
+        if not update_dict:
+            # Empty PATCH: nothing to write or invalidate
+            return event
 
         # Cannot update published/cancelled events extensively
-        if event.status in [EventStatus.PUBLISHED, EventStatus.CANCELLED]:
+        if event.status in _UPDATE_LOCKED_STATUSES:
             # Only allow limited updates for published/cancelled events
-            allowed_fields = {"description", "featured_image_url", "banner_image_url"}
-            update_dict = event_data.model_dump(exclude_unset=True)
-            if not all(key in allowed_fields for key in update_dict.keys()):
+            if update_dict.keys() - _ALLOWED_LOCKED_UPDATE_FIELDS:
                 raise HTTPException(
                     status_code=status.HTTP_400_BAD_REQUEST,
                     detail=f"Cannot modify core details of {event.status.value} events"
                 )
 
-        # Apply updates
-        update_dict = event_data.model_dump(exclude_unset=True)
-        for field, value in update_dict.items():
-            setattr(event, field, value)
-
-        event.updated_at = datetime.now(timezone.utc)
+        event = await self._update_event_returning(
+            event, **update_dict, updated_at=datetime.now(timezone.utc)
+        )
 
         await self.db.commit()
-        await self.db.refresh(event)
-        await self.db.refresh(event, ["promoter", "ticket_tiers"])
+        await invalidate_event(event.id)
 
         return event
 
@@ -282,19 +605,30 @@ class EventService:
         Raises:
             HTTPException: If unauthorized or event has sold tickets
         """
-        event = await self.get_event(event_id)
-        await self._check_event_permission(event, user_id)
+        if not hard_delete:
+            # Common case: one guarded UPDATE checks existence, permission
+            # and sold tickets and soft-deletes in a single round trip. Only
+            # when it matches nothing is the event loaded to find out why.
+            result = await self.db.execute(
+                _SOFT_DELETE_STMT,
+                {"event_id": event_id, "user_id": user_id, "now": datetime.now(timezone.utc)},
+            )
+            if result.first() is not None:
+                await self.db.commit()
+                await invalidate_event(event_id)
+                return
+
+        event = await self._load_event_for_write(event_id, user_id)
 
         # Check if event has sold tickets
-        if event.status == EventStatus.PUBLISHED:
-            # Check for sold tickets
-            from src.models.tickets import Ticket
-            ticket_query = select(func.count()).select_from(Ticket).where(
-                Ticket.event_id == event_id
+        if event.status is EventStatus.PUBLISHED:
+            # Only presence matters; EXISTS stops at the first ticket
+            # (served by idx_tickets_event_id)
+            has_tickets = await self.db.scalar(
+                select(exists().where(Ticket.event_id == event_id))
             )
-            ticket_count = await self.db.scalar(ticket_query)
-            
-            if ticket_count and ticket_count > 0:
+
+            if has_tickets:
                 raise HTTPException(
                     status_code=status.HTTP_400_BAD_REQUEST,
                     detail="Cannot delete event with sold tickets. Cancel the event instead."
@@ -307,6 +641,7 @@ class EventService:
             event.status = EventStatus.CANCELLED
 
         await self.db.commit()
+        await invalidate_event(event_id)
 
     # ========================================================================
     # Status Management
@@ -332,11 +667,10 @@ class EventService:
         Raises:
             HTTPException: If unauthorized or event not ready for publishing
         """
-        event = await self.get_event(event_id)
-        await self._check_event_permission(event, user_id)
+        event = await self._load_event_for_write(event_id, user_id)
 
         # Validate event can be published
-        if event.status != EventStatus.DRAFT:
+        if event.status is not EventStatus.DRAFT:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail=f"Only draft events can be published (current status: {event.status.value})"
@@ -370,13 +704,15 @@ class EventService:
             )
 
         # Publish the event
-        event.status = EventStatus.PUBLISHED
-        event.is_featured = publish_data.is_featured
-        event.updated_at = datetime.now(timezone.utc)
+        event = await self._update_event_returning(
+            event,
+            status=EventStatus.PUBLISHED,
+            is_featured=publish_data.is_featured,
+            updated_at=datetime.now(timezone.utc),
+        )
 
         await self.db.commit()
-        await self.db.refresh(event)
-        await self.db.refresh(event, ["promoter", "ticket_tiers"])
+        await invalidate_event(event.id)
 
         return event
 
@@ -400,29 +736,32 @@ class EventService:
         Raises:
             HTTPException: If unauthorized
         """
-        event = await self.get_event(event_id)
-        await self._check_event_permission(event, user_id)
+        event = await self._load_event_for_write(event_id, user_id)
 
-        if event.status == EventStatus.CANCELLED:
+        if event.status is EventStatus.CANCELLED:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Event is already cancelled"
             )
 
-        if event.status == EventStatus.COMPLETED:
+        if event.status is EventStatus.COMPLETED:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Cannot cancel completed events"
             )
 
         # Update event status
-        event.status = EventStatus.CANCELLED
-        event.cancellation_reason = cancel_data.reason
-        event.cancelled_at = datetime.now(timezone.utc)
-        event.updated_at = datetime.now(timezone.utc)
+        now = datetime.now(timezone.utc)
+        event = await self._update_event_returning(
+            event,
+            status=EventStatus.CANCELLED,
+            cancellation_reason=cancel_data.reason,
+            cancelled_at=now,
+            updated_at=now,
+        )
 
         await self.db.commit()
-        await self.db.refresh(event)
+        await invalidate_event(event.id)
 
         # TODO: Handle refunds if cancel_data.refund_attendees is True
         # This will be implemented in the payment service
@@ -447,26 +786,27 @@ class EventService:
         Raises:
             HTTPException: If unauthorized or event not past
         """
-        event = await self.get_event(event_id)
-        await self._check_event_permission(event, user_id)
+        event = await self._load_event_for_write(event_id, user_id)
 
-        if event.status == EventStatus.COMPLETED:
+        if event.status is EventStatus.COMPLETED:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Event is already marked as completed"
             )
 
-        if event.end_time > datetime.now(timezone.utc):
+        now = datetime.now(timezone.utc)
+        if event.end_time > now:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Cannot mark event as completed before end time"
             )
 
-        event.status = EventStatus.COMPLETED
-        event.updated_at = datetime.now(timezone.utc)
+        event = await self._update_event_returning(
+            event, status=EventStatus.COMPLETED, updated_at=now
+        )
 
         await self.db.commit()
-        await self.db.refresh(event)
+        await invalidate_event(event.id)
 
         return event
 
@@ -474,63 +814,139 @@ class EventService:
     # Permission and Validation Helpers
     # ========================================================================
 
-    async def _get_promoter(self, promoter_id: int) -> Promoter:
-        """Get promoter by ID."""
-        query = select(Promoter).where(Promoter.id == promoter_id)
-        result = await self.db.execute(query)
+    async def _update_event_returning(self, event: Event, **values) -> Event:
+        """
+        UPDATE an event and refresh it from the RETURNING row.
+
+        Replaces setting attributes, flushing and re-selecting the event:
+        the updated values come back from the UPDATE itself and are synced
+        onto ``event``, whose already-loaded promoter and tiers are kept.
+
+        Args:
+            event: Event loaded in this session
+            **values: Column values keyed by Event attribute name
+
+        Returns:
+            The same Event instance, refreshed
+        """
+        result = await self.db.execute(
+            update(Event)
+            .where(Event.id == event.id)
+            .values(**values)
+            .returning(Event)
+        )
+        return result.scalar_one()
+
+    async def _get_verified_promoter(self, promoter_id: int) -> Promoter:
+        """
+        Get a promoter (with its user) and check it is verified.
+
+        Returns:
+            Promoter instance, reused as the new event's promoter
+
+        Raises:
+            HTTPException: 404 if promoter not found, 403 if not verified
+        """
+        result = await self.db.execute(
+            _VERIFIED_PROMOTER_STMT, {"promoter_id": promoter_id}
+        )
         promoter = result.scalar_one_or_none()
 
-        if not promoter:
+        if promoter is None:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Promoter not found"
             )
 
+        if not promoter.is_verified:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Promoter account must be verified to create events"
+            )
+
         return promoter
 
-    async def _check_event_permission(
-        self, 
-        event: Event, 
-        user_id: int
-    ) -> None:
+    async def _load_event_for_write(
+        self,
+        event_id: int,
+        user_id: int,
+    ) -> Event:
         """
-        Check if user has permission to modify event.
+        Load an event for modification and check the user may modify it.
+
+        The event, its promoter and the acting user are fetched in one
+        query rather than loading the event and then the user separately.
 
         Args:
-            event: Event to check
-            user_id: User ID to check
+            event_id: Event ID
+            user_id: ID of the user modifying the event
+
+        Returns:
+            Event instance with promoter (and its user) and ticket tiers loaded
 
         Raises:
-            HTTPException: If user lacks permission
+            HTTPException: If event not found or user lacks permission
         """
-        # Get user
-        user_query = select(User).where(User.id == user_id)
-        result = await self.db.execute(user_query)
-        user = result.scalar_one_or_none()
+        result = await self.db.execute(
+            _EVENT_FOR_WRITE_STMT, {"event_id": event_id, "user_id": user_id}
+        )
+        row = result.one_or_none()
 
-        if not user:
+        if row is None:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
-                detail="User not found"
+                detail="Event not found"
             )
 
-        # Admins can modify any event
-        if user.role == UserRole.ADMIN:
-            return
+        event, user = row
 
-        # Load promoter relationship if not loaded
-        if not event.promoter:
-            await self.db.refresh(event, ["promoter"])
-
-        # Check if user owns the event through promoter
-        if event.promoter.user_id != user_id:
+        # Admins can modify any event; others must own it through the promoter
+        if user.role != UserRole.ADMIN and event.promoter.user_id != user_id:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="You don't have permission to modify this event"
             )
 
-    async def increment_view_count(self, event_id: int) -> None:
-        """Increment event view counter."""
-        event = await self.get_event(event_id)
-        event.view_count += 1
+        return event
+
+    async def _estimate_count(self, status_filter: Optional[EventStatus]) -> int:
+        """
+        Estimated number of events, optionally with one status.
+
+        Table row estimate (pg_class.reltuples) times the status's
+        frequency from pg_stats, cached for
+        ``event_count_estimate_ttl_seconds``. Past events are included, so
+        it is only used for ``include_past`` listings; soft-deleted rows
+        are included too and are assumed to be a small share.
+        """
+        stats = _event_stats_cache.get("events")
+        if stats is None:
+            row = (await self.db.execute(_EVENT_STATS_STMT)).one()
+            stats = (
+                max(row.reltuples, 0),
+                dict(zip(row.status_values or (), row.status_freqs or ())),
+            )
+            _event_stats_cache["events"] = stats
+
+        row_estimate, status_freqs = stats
+        if status_filter is None or not status_freqs:
+            return row_estimate
+        return int(row_estimate * status_freqs.get(status_filter.value, 0.0))
+
+    async def apply_view_deltas(self, deltas: dict[int, int]) -> None:
+        """
+        Add buffered view counts to many events in one statement.
+
+        Args:
+            deltas: Views to add, keyed by event ID
+        """
+        view_deltas = values(
+            column("id", Integer), column("delta", Integer), name="view_deltas"
+        ).data(list(deltas.items()))
+
+        await self.db.execute(
+            update(Event)
+            .where(Event.id == view_deltas.c.id)
+            .values(view_count=Event.view_count + view_deltas.c.delta)
+        )
         await self.db.commit()
@@ -12,11 +12,25 @@ Provides routes for:
 - POST /events/{event_id}/complete - Mark event as completed (owner/admin only)
 """
 
-from typing import Optional
+from typing import Literal, Optional
+
 from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import ORJSONResponse, Response
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.core.database import get_db
+from src.core.event_cache import (
+    cache_event,
+    cache_event_list,
+    claim_event_fill,
+    event_detail_key,
+    event_list_key,
+    get_cached_event,
+    get_cached_event_list,
+    wait_for_cached_event,
+)
+from src.core.view_counts import record_view
 from src.core.dependencies import get_current_user, get_current_promoter_user
 from src.models.users import User
 from src.models.events import EventStatus
@@ -34,7 +48,15 @@ from src.schemas.common import (
     MessageResponse,
     PagedResponse,
 )
-from src.services.event_service import EventService
+from src.services.event_service import EventService, EventSortField
+
+# Built once at import (schema construction is the expensive part):
+# validates and dumps a whole page of ORM events in one call each
+_EVENT_LIST_ADAPTER = TypeAdapter(list[EventListResponse])
+# Single-event responses are validated from the ORM object and dumped
+# straight to JSON bytes by pydantic-core, with no intermediate dict
+_EVENT_ADAPTER = TypeAdapter(EventResponse)
+_EVENT_DETAIL_ADAPTER = TypeAdapter(EventDetailResponse)
 
 # Create router with prefix and tags
 router = APIRouter(
@@ -48,6 +70,17 @@ router = APIRouter(
 )
 
 
+def _event_response(event, status_code: int = status.HTTP_200_OK) -> Response:
+    """Serialize an event as an EventResponse JSON response."""
+    return Response(
+        content=_EVENT_ADAPTER.dump_json(
+            _EVENT_ADAPTER.validate_python(event, from_attributes=True)
+        ),
+        status_code=status_code,
+        media_type="application/json",
+    )
+
+
 # ============================================================================
 # Event CRUD Endpoints
 # ============================================================================
@@ -63,7 +96,7 @@ async def create_event(
     event_data: EventCreate,
     current_user: User = Depends(get_current_promoter_user),
     db: AsyncSession = Depends(get_db)
-) -> EventResponse:
+) -> Response:
     """
     Create a new event.
     
@@ -93,12 +126,13 @@ async def create_event(
         promoter_id=current_user.promoter.id
     )
     
-    return EventResponse.model_validate(event)
+    return _event_response(event, status_code=status.HTTP_201_CREATED)
 
 
 @router.get(
     "",
     response_model=PagedResponse[EventListResponse],
+    response_class=ORJSONResponse,
     summary="List events",
     description="Get a paginated list of events with optional filters"
 )
@@ -111,8 +145,14 @@ async def list_events(
     is_featured: Optional[bool] = Query(None, description="Filter by featured status"),
     search: Optional[str] = Query(None, description="Search in title, description, venue"),
     include_past: bool = Query(False, description="Include past events"),
+    sort_by: EventSortField = Query("start_time", description="Field to sort by"),
+    sort_order: Literal["asc", "desc"] = Query("desc", description="Sort order"),
+    cursor: Optional[str] = Query(
+        None,
+        description="next_cursor from the previous page (preferred over skip for deep pages)",
+    ),
     db: AsyncSession = Depends(get_db)
-) -> PagedResponse[EventListResponse]:
+) -> Response:
     """
     List events with filters and pagination.
     
@@ -126,18 +166,35 @@ async def list_events(
     - search: Search in title, description, and venue
     - include_past: Include events that have already ended
     
+    **Sorting:**
+    - sort_by: start_time (default), published_at, or relevance (requires search)
+    - sort_order: asc or desc (default)
+    
     **Pagination:**
+    - cursor: Keyset cursor (next_cursor of the previous page); recommended,
+      page cost depends on limit, not depth. start_time sort only; total is
+      null on cursor pages.
     - skip: Offset for pagination
     - limit: Maximum results per page (max 100)
     
     **Returns:**
     - Paginated list of events
-    - Total count
+    - Total count (null on cursor pages, approximate for very large
+      listings; see total_is_estimate)
     - Page information
     """
+    cache_key = await event_list_key((
+        skip, limit, status_filter, promoter_id, category, is_featured,
+        search, include_past, sort_by, sort_order, cursor,
+    ))
+    if cache_key is not None:
+        payload = await get_cached_event_list(cache_key)
+        if payload is not None:
+            return Response(content=payload, media_type="application/json")
+
     service = EventService(db)
     
-    events, total = await service.list_events(
+    page = await service.list_events(
         skip=skip,
         limit=limit,
         status_filter=status_filter,
@@ -146,18 +203,28 @@ async def list_events(
         is_featured=is_featured,
         search=search,
         include_past=include_past,
+        sort_by=sort_by,
+        sort_order=sort_order,
+        cursor=cursor,
     )
     
-    # Convert to response models
-    event_responses = [EventListResponse.model_validate(e) for e in events]
+    # Convert to response models (one validator call for the whole page)
+    event_responses = _EVENT_LIST_ADAPTER.validate_python(page.events, from_attributes=True)
     
-    return PagedResponse(
+    response = PagedResponse.to_orjson_response(
         items=event_responses,
-        total=total,
-        page=skip // limit + 1,
-        size=limit,
-        pages=(total + limit - 1) // limit if total > 0 else 0
+        total=page.total,
+        skip=skip,
+        limit=limit,
+        next_cursor=page.next_cursor,
+        total_is_estimate=page.total_is_estimate,
+        adapter=_EVENT_LIST_ADAPTER,
+        has_more=page.has_more,
     )
+    if cache_key is not None:
+        await cache_event_list(cache_key, response.body)
+
+    return response
 
 
 @router.get(
@@ -169,7 +236,7 @@ async def list_events(
 async def get_event(
     event_id: int,
     db: AsyncSession = Depends(get_db)
-) -> EventDetailResponse:
+) -> Response:
     """
     Get detailed event information.
     
@@ -181,16 +248,37 @@ async def get_event(
     - Ticket tier information
     - Availability status
     
-    **Note:** View count is incremented on each request
+    **Note:** View count is incremented on each request. Published events
+    are served from a short-lived cache, so counts may lag slightly.
     """
     service = EventService(db)
-    
-    event = await service.get_event(event_id)
-    
-    # Increment view count (async, don't await)
-    await service.increment_view_count(event_id)
-    
-    return EventDetailResponse.model_validate(event)
+
+    cache_key = await event_detail_key(event_id)
+    payload = None
+    if cache_key is not None:
+        payload = await get_cached_event(cache_key)
+        if payload is None and not await claim_event_fill(event_id):
+            # Another request is rebuilding it; don't stampede the database
+            payload = await wait_for_cached_event(cache_key)
+
+    if payload is None:
+        try:
+            event = await service.get_event(event_id)
+        except HTTPException:
+            if cache_key is not None:
+                await cache_event(event_id, cache_key, None)  # release claim
+            raise
+        payload = _EVENT_DETAIL_ADAPTER.dump_json(
+            _EVENT_DETAIL_ADAPTER.validate_python(event, from_attributes=True)
+        )
+        if cache_key is not None:
+            is_public = event.status is EventStatus.PUBLISHED
+            await cache_event(event_id, cache_key, payload if is_public else None)
+
+    # Buffered and written to the database in batches
+    await record_view(event_id)
+
+    return Response(content=payload, media_type="application/json")
 
 
 @router.put(
@@ -204,7 +292,7 @@ async def update_event(
     event_data: EventUpdate,
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
-) -> EventResponse:
+) -> Response:
     """
     Update an event.
     
@@ -225,7 +313,7 @@ async def update_event(
         user_id=current_user.id
     )
     
-    return EventResponse.model_validate(event)
+    return _event_response(event)
 
 
 @router.delete(
@@ -239,7 +327,7 @@ async def delete_event(
     hard_delete: bool = Query(False, description="Permanently delete (cannot be undone)"),
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
-) -> MessageResponse:
+) -> Response:
     """
     Delete an event (soft delete by default).
     
@@ -268,10 +356,7 @@ async def delete_event(
     
     delete_type = "permanently deleted" if hard_delete else "cancelled and archived"
     
-    return MessageResponse(
-        message=f"Event successfully {delete_type}",
-        success=True
-    )
+    return MessageResponse.as_response(f"Event successfully {delete_type}")
 
 
 # ============================================================================
@@ -289,7 +374,7 @@ async def publish_event(
     publish_data: PublishEventRequest,
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
-) -> EventResponse:
+) -> Response:
     """
     Publish an event.
     
@@ -321,7 +406,7 @@ async def publish_event(
         publish_data=publish_data
     )
     
-    return EventResponse.model_validate(event)
+    return _event_response(event)
 
 
 @router.post(
@@ -335,7 +420,7 @@ async def cancel_event(
     cancel_data: CancelEventRequest,
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
-) -> EventResponse:
+) -> Response:
     """
     Cancel an event.
     
@@ -362,7 +447,7 @@ async def cancel_event(
         cancel_data=cancel_data
     )
     
-    return EventResponse.model_validate(event)
+    return _event_response(event)
 
 
 @router.post(
@@ -375,7 +460,7 @@ async def complete_event(
     event_id: int,
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
-) -> EventResponse:
+) -> Response:
     """
     Mark an event as completed.
     
@@ -399,7 +484,7 @@ async def complete_event(
         user_id=current_user.id
     )
     
-    return EventResponse.model_validate(event)
+    return _event_response(event)
 
 
 # ============================================================================
@@ -409,6 +494,7 @@ async def complete_event(
 @router.get(
     "/my/events",
     response_model=PagedResponse[EventListResponse],
+    response_class=ORJSONResponse,
     summary="Get my events",
     description="Get all events created by the current promoter"
 )
@@ -416,9 +502,10 @@ async def get_my_events(
     skip: int = Query(0, ge=0),
     limit: int = Query(20, ge=1, le=100),
     status_filter: Optional[EventStatus] = Query(None),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
     current_user: User = Depends(get_current_promoter_user),
     db: AsyncSession = Depends(get_db)
-) -> PagedResponse[EventListResponse]:
+) -> ORJSONResponse:
     """
     Get all events created by current promoter.
     
@@ -440,20 +527,24 @@ async def get_my_events(
             detail="User must have a promoter account"
         )
     
-    events, total = await service.list_events(
+    page = await service.list_events(
         skip=skip,
         limit=limit,
         status_filter=status_filter,
         promoter_id=current_user.promoter.id,
         include_past=True,  # Include all events for promoter
+        cursor=cursor,
     )
     
-    event_responses = [EventListResponse.model_validate(e) for e in events]
+    event_responses = _EVENT_LIST_ADAPTER.validate_python(page.events, from_attributes=True)
     
-    return PagedResponse(
+    return PagedResponse.to_orjson_response(
         items=event_responses,
-        total=total,
-        page=skip // limit + 1,
-        size=limit,
-        pages=(total + limit - 1) // limit if total > 0 else 0
+        total=page.total,
+        skip=skip,
+        limit=limit,
+        next_cursor=page.next_cursor,
+        total_is_estimate=page.total_is_estimate,
+        adapter=_EVENT_LIST_ADAPTER,
+        has_more=page.has_more,
     )
@@ -8,21 +8,39 @@ This module:
 - Sets up CORS, error handling, etc.
 """
 
+import logging
 from contextlib import asynccontextmanager
+
+import orjson
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse, Response
 from slowapi import Limiter
 from slowapi.util import get_remote_address
 from slowapi.errors import RateLimitExceeded
 
 from src.api.auth import router as auth_router
 from src.api.events import router as events_router
-from src.core.database import engine, Base
+from src.core.cache import close_redis
+from src.core.database import engine, Base, pool_status
+from src.core.email_queue import start_email_worker, stop_email_worker
+from src.core.view_counts import start_view_count_flusher, stop_view_count_flusher
 from src.core.config import settings
 
-# Rate limiter for API protection
-limiter = Limiter(key_func=get_remote_address)
+# Application loggers share the root handler with uvicorn (see __main__);
+# a no-op if logging was already configured (e.g. uvicorn --log-config)
+logging.basicConfig(
+    level=settings.log_level.upper(),
+    format="%(asctime)s %(levelname)s %(name)s: %(message)s",
+)
+logger = logging.getLogger(__name__)
+
+# Rate limiter for API protection. No route declares a limit yet, so it
+# keeps slowapi's in-memory storage rather than a (blocking) Redis client.
+limiter = Limiter(
+    key_func=get_remote_address,
+    enabled=settings.enable_rate_limiting,
+)
 
 
 # ============================================================================
@@ -37,16 +55,23 @@ async def lifespan(app: FastAPI):
     Handles startup and shutdown events.
     """
     # Startup
-    print("⚙️  Performing startup checks...")
-    print(f"🌍 Environment: {settings.ENVIRONMENT}")
-    print(f"🐛 Debug Mode: {settings.DEBUG}")
-    print("✅ Startup checks complete")
+    logger.info(
+        "Starting up: environment=%s debug=%s",
+        settings.environment,
+        settings.debug,
+    )
+    start_email_worker()
+    start_view_count_flusher()
+    logger.info("Startup complete")
     
     yield
     
     # Shutdown
-    print("⚠️  Performing shutdown cleanup...")
-    print("✅ Shutdown cleanup complete")
+    logger.info("Shutting down")
+    await stop_view_count_flusher()
+    await stop_email_worker()
+    await close_redis()
+    logger.info("Shutdown complete")
 
 
 # ============================================================================
@@ -61,6 +86,8 @@ app = FastAPI(
     redoc_url="/api/redoc",
     openapi_url="/api/openapi.json",
     lifespan=lifespan,
+    # Routes without an explicit response class serialize with orjson
+    default_response_class=ORJSONResponse,
 )
 
 # Attach rate limiter to app
@@ -88,7 +115,7 @@ app.add_middleware(
 @app.exception_handler(RateLimitExceeded)
 async def rate_limit_handler(request: Request, exc: RateLimitExceeded):
     """Handle rate limit exceeded errors."""
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=429,
         content={
             "error": "rate_limit_exceeded",
@@ -102,27 +129,46 @@ async def rate_limit_handler(request: Request, exc: RateLimitExceeded):
 # Root Endpoints
 # ============================================================================
 
+# Pre-serialized API index payload
+_ROOT_PAYLOAD = orjson.dumps({
+    "name": "Ticket Vendor API",
+    "version": "1.0.0",
+    "status": "running",
+    "docs": "/api/docs",
+    "api_version": "v1",
+    "endpoints": {
+        "auth": "/auth",
+        "events": "/events",
+        "tickets": "/tickets",
+        "orders": "/orders",
+        "waitlist": "/waitlist"
+    }
+})
+
+# Pre-serialized liveness payload (hit by every load balancer probe)
+_HEALTH_PAYLOAD = orjson.dumps({
+    "status": "healthy",
+    "environment": settings.environment,
+    "debug": settings.debug,
+    "api_version": "1.0.0",
+    "features": {
+        "authentication": "active",
+        "events": "active",
+        "tickets": "pending",
+        "orders": "pending",
+        "payments": "pending"
+    }
+})
+
+
 @app.get("/", tags=["root"])
 async def root():
     """
     API root endpoint.
     
-    Returns basic information about the API.
+    Returns basic information about the API (serialized once at import).
     """
-    return {
-        "name": "Ticket Vendor API",
-        "version": "1.0.0",
-        "status": "running",
-        "docs": "/api/docs",
-        "api_version": "v1",
-        "endpoints": {
-            "auth": "/auth",
-            "events": "/events",
-            "tickets": "/tickets",
-            "orders": "/orders",
-            "waitlist": "/waitlist"
-        }
-    }
+    return Response(content=_ROOT_PAYLOAD, media_type="application/json")
 
 
 @app.get("/health", tags=["root"])
@@ -130,21 +176,21 @@ async def health_check():
     """
     Health check endpoint.
     
-    Returns the health status of the API.
+    Returns the health status of the API. The payload is constant for the
+    lifetime of the process, so it is serialized once at import.
     """
-    return {
-        "status": "healthy",
-        "environment": settings.ENVIRONMENT,
-        "debug": settings.DEBUG,
-        "api_version": "1.0.0",
-        "features": {
-            "authentication": "active",
-            "events": "active",
-            "tickets": "pending",
-            "orders": "pending",
-            "payments": "pending"
-        }
-    }
+    return Response(content=_HEALTH_PAYLOAD, media_type="application/json")
+
+
+if settings.debug:
+    @app.get("/debug/pool", tags=["root"], include_in_schema=False)
+    async def debug_pool():
+        """
+        Connection pool counters (debug mode only).
+
+        Useful when load testing to pick pool_size / max_overflow.
+        """
+        return pool_status()
 
 
 # ============================================================================
@@ -174,6 +220,7 @@ if __name__ == "__main__":
         "main:app",
         host="0.0.0.0",
         port=8000,
-        reload=settings.DEBUG,
-        log_level="info"
+        reload=settings.debug,
+        # Let uvicorn's loggers propagate to the root handler set up above
+        log_config=None,
     )
@@ -2,11 +2,14 @@
 Order and purchase schemas for ticket buying flow.
 """
 
-from pydantic import BaseModel, Field, validator, EmailStr
+from pydantic import BaseModel, ConfigDict, Field
 from datetime import datetime
-from typing import Optional
+from typing import Literal, Optional
 from enum import Enum
 
+from src.models.enums import PaymentStatus
+from src.schemas.common import ORM_RESPONSE_CONFIG, EmailAddressStr
+
 
 class OrderStatus(str, Enum):
     """Order status enumeration."""
@@ -17,13 +20,11 @@ class OrderStatus(str, Enum):
     REFUNDED = "refunded"
 
 
-class PaymentStatus(str, Enum):
-    """Payment status enumeration."""
-
-    PENDING = "pending"
-    COMPLETED = "completed"
-    FAILED = "failed"
-    REFUNDED = "refunded"
+# Wire values of the statuses above. Response models declare these Literals,
+# which pydantic-core checks as a plain string-set lookup; ORM Enum members
+# validate as their values.
+OrderStatusValue = Literal["pending", "confirmed", "cancelled", "refunded"]
+PaymentStatusValue = Literal["pending", "completed", "failed", "refunded"]
 
 
 class OrderItemRequest(BaseModel):
@@ -31,60 +32,43 @@ class OrderItemRequest(BaseModel):
 
     tier_id: int = Field(
         ge=1,
-        description="Ticket tier ID"
+        description="Ticket tier ID",
+        examples=[1]
     )
     quantity: int = Field(
         ge=1,
         le=1000,
-        description="Number of tickets to purchase"
+        description="Number of tickets to purchase",
+        examples=[2]
     )
 
-    class Config:
-        """Pydantic configuration."""
-        schema_extra = {
-            "example": {
-                "tier_id": 1,
-                "quantity": 2
-            }
-        }
-
 
 class CreateOrderRequest(BaseModel):
     """Create order request schema."""
 
     event_id: int = Field(
         ge=1,
-        description="Event ID"
+        description="Event ID",
+        examples=[1]
     )
     items: list[OrderItemRequest] = Field(
-        min_items=1,
-        max_items=100,
-        description="Items to purchase"
+        min_length=1,
+        max_length=100,
+        description="Items to purchase",
+        examples=[[{"tier_id": 1, "quantity": 2}, {"tier_id": 2, "quantity": 1}]]
     )
-    billing_email: Optional[EmailStr] = Field(
+    billing_email: Optional[EmailAddressStr] = Field(
         default=None,
-        description="Billing email (defaults to user email)"
+        description="Billing email (defaults to user email)",
+        examples=["john@example.com"]
     )
     billing_name: Optional[str] = Field(
         default=None,
         max_length=255,
-        description="Billing name"
+        description="Billing name",
+        examples=["John Doe"]
     )
 
-    class Config:
-        """Pydantic configuration."""
-        schema_extra = {
-            "example": {
-                "event_id": 1,
-                "items": [
-                    {"tier_id": 1, "quantity": 2},
-                    {"tier_id": 2, "quantity": 1}
-                ],
-                "billing_email": "john@example.com",
-                "billing_name": "John Doe"
-            }
-        }
-
 
 class BillingAddress(BaseModel):
     """Billing address schema."""
@@ -95,36 +79,40 @@ class BillingAddress(BaseModel):
     postal_code: str = Field(max_length=20, description="Postal code")
     country: str = Field(min_length=2, max_length=2, description="Country code")
 
+    model_config = ConfigDict(frozen=True, defer_build=True)
+
 
 class CreateOrderWithBillingRequest(BaseModel):
     """Create order with full billing information."""
 
-    event_id: int = Field(ge=1, description="Event ID")
-    items: list[OrderItemRequest] = Field(min_items=1, description="Items to purchase")
-    billing_email: EmailStr = Field(description="Billing email")
-    billing_name: str = Field(max_length=255, description="Billing name")
+    event_id: int = Field(ge=1, description="Event ID", examples=[1])
+    items: list[OrderItemRequest] = Field(
+        min_length=1,
+        description="Items to purchase",
+        examples=[[{"tier_id": 1, "quantity": 2}]]
+    )
+    billing_email: EmailAddressStr = Field(
+        description="Billing email",
+        examples=["john@example.com"]
+    )
+    billing_name: str = Field(
+        max_length=255,
+        description="Billing name",
+        examples=["John Doe"]
+    )
     billing_address: Optional[BillingAddress] = Field(
         default=None,
-        description="Billing address"
+        description="Billing address",
+        examples=[{
+            "street": "123 Main St",
+            "city": "New York",
+            "state": "NY",
+            "postal_code": "10001",
+            "country": "US"
+        }]
     )
 
-    class Config:
-        """Pydantic configuration."""
-        schema_extra = {
-            "example": {
-                "event_id": 1,
-                "items": [{"tier_id": 1, "quantity": 2}],
-                "billing_email": "john@example.com",
-                "billing_name": "John Doe",
-                "billing_address": {
-                    "street": "123 Main St",
-                    "city": "New York",
-                    "state": "NY",
-                    "postal_code": "10001",
-                    "country": "US"
-                }
-            }
-        }
+    model_config = ConfigDict(defer_build=True)
 
 
 class OrderItemResponse(BaseModel):
@@ -137,50 +125,37 @@ class OrderItemResponse(BaseModel):
     unit_price: float = Field(description="Price per ticket")
     subtotal: float = Field(description="Line item total")
 
-    class Config:
-        """Pydantic configuration."""
-        from_attributes = True
+    model_config = ORM_RESPONSE_CONFIG
 
 
 class OrderResponse(BaseModel):
     """Order response schema."""
 
-    id: int = Field(description="Order ID")
-    uuid: str = Field(description="Order UUID")
-    order_number: str = Field(description="Order number")
-    event_id: int = Field(description="Event ID")
+    id: int = Field(description="Order ID", examples=[1])
+    uuid: str = Field(
+        description="Order UUID",
+        examples=["550e8400-e29b-41d4-a716-446655440000"]
+    )
+    order_number: str = Field(description="Order number", examples=["ORD-2025-001"])
+    event_id: int = Field(description="Event ID", examples=[1])
     event_title: Optional[str] = Field(default=None, description="Event title")
-    status: str = Field(description="Order status")
-    payment_status: str = Field(description="Payment status")
-    subtotal: float = Field(description="Subtotal before fees/tax")
-    service_fee: float = Field(description="Service fee")
-    tax: float = Field(description="Tax")
-    total_amount: float = Field(description="Total amount")
-    currency: str = Field(description="Currency code")
+    status: OrderStatusValue = Field(description="Order status", examples=["pending"])
+    payment_status: PaymentStatusValue = Field(
+        description="Payment status",
+        examples=["pending"]
+    )
+    subtotal: float = Field(description="Subtotal before fees/tax", examples=[99.98])
+    service_fee: float = Field(description="Service fee", examples=[5.00])
+    tax: float = Field(description="Tax", examples=[8.40])
+    total_amount: float = Field(description="Total amount", examples=[113.38])
+    currency: str = Field(description="Currency code", examples=["USD"])
     items: list[OrderItemResponse] = Field(description="Order items")
     created_at: datetime = Field(description="Creation timestamp")
     updated_at: datetime = Field(description="Last update timestamp")
     expires_at: Optional[datetime] = Field(default=None, description="Order expiration time")
     confirmed_at: Optional[datetime] = Field(default=None, description="Confirmation time")
 
-    class Config:
-        """Pydantic configuration."""
-        from_attributes = True
-        schema_extra = {
-            "example": {
-                "id": 1,
-                "uuid": "550e8400-e29b-41d4-a716-446655440000",
-                "order_number": "ORD-2025-001",
-                "event_id": 1,
-                "status": "pending",
-                "payment_status": "pending",
-                "subtotal": 99.98,
-                "service_fee": 5.00,
-                "tax": 8.40,
-                "total_amount": 113.38,
-                "currency": "USD"
-            }
-        }
+    model_config = ORM_RESPONSE_CONFIG
 
 
 class OrderDetailResponse(BaseModel):
@@ -191,8 +166,8 @@ class OrderDetailResponse(BaseModel):
     order_number: str = Field(description="Order number")
     event_id: int = Field(description="Event ID")
     event: "EventOrderInfo" = Field(description="Event details")
-    status: str = Field(description="Order status")
-    payment_status: str = Field(description="Payment status")
+    status: OrderStatusValue = Field(description="Order status")
+    payment_status: PaymentStatusValue = Field(description="Payment status")
     subtotal: float = Field(description="Subtotal")
     service_fee: float = Field(description="Service fee")
     tax: float = Field(description="Tax")
@@ -212,9 +187,7 @@ class OrderDetailResponse(BaseModel):
     refund_amount: Optional[float] = Field(default=None, description="Refund amount")
     refund_reason: Optional[str] = Field(default=None, description="Refund reason")
 
-    class Config:
-        """Pydantic configuration."""
-        from_attributes = True
+    model_config = ORM_RESPONSE_CONFIG
 
 
 class EventOrderInfo(BaseModel):
@@ -225,28 +198,23 @@ class EventOrderInfo(BaseModel):
     start_time: datetime = Field(description="Start time")
     venue_name: str = Field(description="Venue name")
 
-    class Config:
-        """Pydantic configuration."""
-        from_attributes = True
+    model_config = ORM_RESPONSE_CONFIG
 
 
 class ConfirmOrderRequest(BaseModel):
     """Confirm order request (after payment)."""
 
-    payment_intent_id: str = Field(description="Stripe payment intent ID")
+    payment_intent_id: str = Field(
+        description="Stripe payment intent ID",
+        examples=["pi_3Kj7L9C0Z3Q7X4W2Q7X4"]
+    )
     payment_method: Optional[str] = Field(
         default=None,
-        description="Payment method used"
+        description="Payment method used",
+        examples=["card"]
     )
 
-    class Config:
-        """Pydantic configuration."""
-        schema_extra = {
-            "example": {
-                "payment_intent_id": "pi_3Kj7L9C0Z3Q7X4W2Q7X4",
-                "payment_method": "card"
-            }
-        }
+    model_config = ConfigDict(defer_build=True)
 
 
 class CancelOrderRequest(BaseModel):
@@ -255,16 +223,11 @@ class CancelOrderRequest(BaseModel):
     reason: str = Field(
         min_length=1,
         max_length=500,
-        description="Cancellation reason"
+        description="Cancellation reason",
+        examples=["I can no longer attend the event"]
     )
 
-    class Config:
-        """Pydantic configuration."""
-        schema_extra = {
-            "example": {
-                "reason": "I can no longer attend the event"
-            }
-        }
+    model_config = ConfigDict(defer_build=True)
 
 
 class RefundOrderRequest(BaseModel):
@@ -273,43 +236,34 @@ class RefundOrderRequest(BaseModel):
     reason: str = Field(
         min_length=1,
         max_length=500,
-        description="Refund reason"
+        description="Refund reason",
+        examples=["Event was cancelled"]
     )
     refund_amount: Optional[float] = Field(
         default=None,
-        description="Amount to refund (defaults to full amount)"
+        description="Amount to refund (defaults to full amount)",
+        examples=[113.38]
     )
 
-    class Config:
-        """Pydantic configuration."""
-        schema_extra = {
-            "example": {
-                "reason": "Event was cancelled",
-                "refund_amount": 113.38
-            }
-        }
+    model_config = ConfigDict(defer_build=True)
 
 
 class PaymentIntentResponse(BaseModel):
     """Stripe payment intent response."""
 
-    client_secret: str = Field(description="Stripe client secret for payment")
-    payment_intent_id: str = Field(description="Stripe payment intent ID")
-    amount: float = Field(description="Amount to charge in cents")
-    currency: str = Field(description="Currency code")
-    status: str = Field(description="Intent status")
-
-    class Config:
-        """Pydantic configuration."""
-        schema_extra = {
-            "example": {
-                "client_secret": "pi_3Kj7L9C0Z3Q7X4W2Q7X4_secret_abc123",
-                "payment_intent_id": "pi_3Kj7L9C0Z3Q7X4W2Q7X4",
-                "amount": 11338,
-                "currency": "usd",
-                "status": "requires_payment_method"
-            }
-        }
+    client_secret: str = Field(
+        description="Stripe client secret for payment",
+        examples=["pi_3Kj7L9C0Z3Q7X4W2Q7X4_secret_abc123"]
+    )
+    payment_intent_id: str = Field(
+        description="Stripe payment intent ID",
+        examples=["pi_3Kj7L9C0Z3Q7X4W2Q7X4"]
+    )
+    amount: float = Field(description="Amount to charge in cents", examples=[11338])
+    currency: str = Field(description="Currency code", examples=["usd"])
+    status: str = Field(description="Intent status", examples=["requires_payment_method"])
+
+    model_config = ConfigDict(frozen=True, defer_build=True)
 
 
 class OrderListResponse(BaseModel):
@@ -318,37 +272,27 @@ class OrderListResponse(BaseModel):
     id: int = Field(description="Order ID")
     order_number: str = Field(description="Order number")
     event_title: str = Field(description="Event title")
-    status: str = Field(description="Order status")
+    status: OrderStatusValue = Field(description="Order status")
     total_amount: float = Field(description="Total amount")
     currency: str = Field(description="Currency")
     tickets_count: int = Field(description="Number of tickets")
     created_at: datetime = Field(description="Creation timestamp")
 
-    class Config:
-        """Pydantic configuration."""
-        from_attributes = True
+    model_config = ORM_RESPONSE_CONFIG
 
 
 class CreateOrderResponse(BaseModel):
     """Response when creating an order."""
 
     order: OrderResponse = Field(description="Created order")
-    message: str = Field(description="Status message")
-    expires_in: int = Field(description="Order expiration time in seconds")
-
-    class Config:
-        """Pydantic configuration."""
-        schema_extra = {
-            "example": {
-                "message": "Order created successfully. Proceed to payment.",
-                "expires_in": 900,
-                "order": {
-                    "id": 1,
-                    "order_number": "ORD-2025-001",
-                    "status": "pending"
-                }
-            }
-        }
+    message: str = Field(
+        description="Status message",
+        examples=["Order created successfully. Proceed to payment."]
+    )
+    expires_in: int = Field(
+        description="Order expiration time in seconds",
+        examples=[900]
+    )
 
 
 # Update forward references
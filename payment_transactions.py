@@ -2,7 +2,6 @@
 Payment Transaction model for tracking payments.
 """
 
-import enum
 from datetime import datetime
 from typing import TYPE_CHECKING
 
@@ -10,6 +9,7 @@ from sqlalchemy import (
     DateTime,
     Enum,
     ForeignKey,
+    Index,
     Integer,
     Numeric,
     String,
@@ -20,20 +20,12 @@ from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql import func
 
 from src.core.database import Base
+from src.models.enums import PaymentStatus
 
 if TYPE_CHECKING:
     from src.models.orders import Order
 
 
-class PaymentStatus(str, enum.Enum):
-    """Payment status enumeration."""
-
-    PENDING = "pending"
-    COMPLETED = "completed"
-    FAILED = "failed"
-    REFUNDED = "refunded"
-
-
 class PaymentTransaction(Base):
     """Payment transaction model for tracking payment processing."""
 
@@ -44,20 +36,26 @@ class PaymentTransaction(Base):
 
     # Foreign Key to Order
     order_id: Mapped[int] = mapped_column(
-        Integer, ForeignKey("orders.id", ondelete="RESTRICT"), nullable=False, index=True
+        Integer, ForeignKey("orders.id", ondelete="RESTRICT"), nullable=False
     )
 
     # Transaction Information
     transaction_id: Mapped[str] = mapped_column(String(255), unique=True, nullable=False, index=True)
     payment_provider: Mapped[str] = mapped_column(String(50), nullable=False)  # e.g., "stripe"
 
-    # Amount
-    amount: Mapped[float] = mapped_column(Numeric(10, 2), nullable=False)
+    # Amount (loaded as float, matching the annotation and the schemas)
+    amount: Mapped[float] = mapped_column(Numeric(10, 2, asdecimal=False), nullable=False)
     currency: Mapped[str] = mapped_column(String(3), default="USD")
 
-    # Status
+    # Status (the native payment_status type from schema.sql; stored as the
+    # lowercase enum values, not the member names)
     status: Mapped[PaymentStatus] = mapped_column(
-        Enum(PaymentStatus, native_enum=False), nullable=False, index=True
+        Enum(
+            PaymentStatus,
+            name="payment_status",
+            values_callable=lambda statuses: [s.value for s in statuses],
+        ),
+        nullable=False,
     )
 
     # Payment Method
@@ -67,8 +65,9 @@ class PaymentTransaction(Base):
     error_code: Mapped[str | None] = mapped_column(String(50))
     error_message: Mapped[str | None] = mapped_column(Text)
 
-    # Metadata
-    metadata: Mapped[dict] = mapped_column(JSONB, default={})
+    # Metadata (``metadata`` is reserved by the declarative base, so the
+    # attribute is renamed while the column keeps its name)
+    extra_metadata: Mapped[dict] = mapped_column("metadata", JSONB, default=dict)
 
     # Timestamps
     created_at: Mapped[datetime] = mapped_column(
@@ -81,6 +80,14 @@ class PaymentTransaction(Base):
     # Relationships
     order: Mapped["Order"] = relationship("Order", back_populates="payment_transactions")
 
+    # Indexes (the composites also serve lookups on their leading column)
+    __table_args__ = (
+        # An order's transactions, optionally by status
+        Index("idx_payment_transactions_order_status", "order_id", "status"),
+        # Sweeping transactions stuck in a status, oldest first
+        Index("idx_payment_transactions_status_created", "status", "created_at"),
+    )
+
     def __repr__(self) -> str:
         return f"<PaymentTransaction(id={self.id}, transaction_id={self.transaction_id}, status={self.status})>"
 
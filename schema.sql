@@ -100,6 +100,25 @@ CREATE TABLE events (
     created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
     updated_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
     deleted_at TIMESTAMP WITH TIME ZONE,
+    -- "City, State, Country" with missing parts skipped; built from
+    -- immutable operators only (concat_ws is not allowed here)
+    location_string VARCHAR(300) GENERATED ALWAYS AS (
+        coalesce(venue_city, '') ||
+        CASE WHEN venue_city IS NOT NULL AND venue_state IS NOT NULL
+            THEN ', ' ELSE '' END ||
+        coalesce(venue_state, '') ||
+        CASE WHEN (venue_city IS NOT NULL OR venue_state IS NOT NULL)
+                AND venue_country IS NOT NULL
+            THEN ', ' ELSE '' END ||
+        coalesce(venue_country, '')
+    ) STORED,
+    search_vector TSVECTOR GENERATED ALWAYS AS (
+        to_tsvector('english',
+            coalesce(title, '') || ' ' ||
+            coalesce(description, '') || ' ' ||
+            coalesce(venue_name, '') || ' ' ||
+            coalesce(venue_city, ''))
+    ) STORED,
     
     CONSTRAINT check_dates CHECK (end_time > start_time),
     CONSTRAINT check_doors_open CHECK (doors_open_time IS NULL OR doors_open_time <= start_time)
@@ -255,6 +274,7 @@ CREATE TABLE audit_log (
     id SERIAL PRIMARY KEY,
     user_id INTEGER REFERENCES users(id) ON DELETE SET NULL,
     action VARCHAR(100) NOT NULL,
+    action_kind SMALLINT NOT NULL DEFAULT 0, -- 0=other, 1=create, 2=update, 3=delete
     entity_type VARCHAR(50) NOT NULL,
     entity_id INTEGER,
     old_data JSONB,
@@ -289,7 +309,7 @@ CREATE INDEX idx_events_published_at ON events(published_at DESC);
 CREATE INDEX idx_events_location ON events(venue_city, venue_state, venue_country);
 CREATE INDEX idx_events_featured ON events(is_featured) WHERE is_featured = true;
 CREATE INDEX idx_events_tags ON events USING GIN(tags);
-CREATE INDEX idx_events_search ON events USING GIN(to_tsvector('english', title || ' ' || description));
+CREATE INDEX idx_events_search ON events USING GIN(search_vector);
 
 -- Ticket Tiers indexes
 CREATE INDEX idx_ticket_tiers_event_id ON ticket_tiers(event_id);
@@ -324,9 +344,9 @@ CREATE INDEX idx_waitlist_position ON waitlist(event_id, position);
 CREATE INDEX idx_waitlist_notified ON waitlist(notified) WHERE notified = false;
 
 -- Payment Transactions indexes
-CREATE INDEX idx_payment_transactions_order_id ON payment_transactions(order_id);
+CREATE INDEX idx_payment_transactions_order_status ON payment_transactions(order_id, status);
 CREATE INDEX idx_payment_transactions_transaction_id ON payment_transactions(transaction_id);
-CREATE INDEX idx_payment_transactions_status ON payment_transactions(status);
+CREATE INDEX idx_payment_transactions_status_created ON payment_transactions(status, created_at);
 
 -- Email Notifications indexes
 CREATE INDEX idx_email_notifications_user_id ON email_notifications(user_id);
@@ -336,6 +356,7 @@ CREATE INDEX idx_email_notifications_created_at ON email_notifications(created_a
 -- Audit Log indexes
 CREATE INDEX idx_audit_log_user_id ON audit_log(user_id);
 CREATE INDEX idx_audit_log_entity ON audit_log(entity_type, entity_id);
+CREATE INDEX idx_audit_log_action_kind ON audit_log(action_kind);
 CREATE INDEX idx_audit_log_created_at ON audit_log(created_at DESC);
 
 -- ============================================================================
@@ -394,16 +415,16 @@ CREATE OR REPLACE FUNCTION create_audit_log()
 RETURNS TRIGGER AS $$
 BEGIN
     IF (TG_OP = 'DELETE') THEN
-        INSERT INTO audit_log (action, entity_type, entity_id, old_data)
-        VALUES (TG_OP, TG_TABLE_NAME, OLD.id, row_to_json(OLD));
+        INSERT INTO audit_log (action, action_kind, entity_type, entity_id, old_data)
+        VALUES (TG_OP, 3, TG_TABLE_NAME, OLD.id, row_to_json(OLD));
         RETURN OLD;
     ELSIF (TG_OP = 'UPDATE') THEN
-        INSERT INTO audit_log (action, entity_type, entity_id, old_data, new_data)
-        VALUES (TG_OP, TG_TABLE_NAME, NEW.id, row_to_json(OLD), row_to_json(NEW));
+        INSERT INTO audit_log (action, action_kind, entity_type, entity_id, old_data, new_data)
+        VALUES (TG_OP, 2, TG_TABLE_NAME, NEW.id, row_to_json(OLD), row_to_json(NEW));
         RETURN NEW;
     ELSIF (TG_OP = 'INSERT') THEN
-        INSERT INTO audit_log (action, entity_type, entity_id, new_data)
-        VALUES (TG_OP, TG_TABLE_NAME, NEW.id, row_to_json(NEW));
+        INSERT INTO audit_log (action, action_kind, entity_type, entity_id, new_data)
+        VALUES (TG_OP, 1, TG_TABLE_NAME, NEW.id, row_to_json(NEW));
         RETURN NEW;
     END IF;
 END;
@@ -512,9 +533,29 @@ COMMENT ON TABLE audit_log IS 'Audit trail for critical operations';
 CREATE INDEX idx_tickets_event_user ON tickets(event_id, user_id);
 CREATE INDEX idx_tickets_order_tier ON tickets(order_id, tier_id);
 CREATE INDEX idx_orders_user_status ON orders(user_id, status);
-CREATE INDEX idx_events_status_start ON events(status, start_time) 
+-- Public listing: live published events by start time. end_time is carried
+-- in the index so the default "upcoming only" filter (end_time > now()) is
+-- checked on index entries before any heap row is visited
+CREATE INDEX idx_events_published_start ON events(start_time DESC, id DESC)
+    INCLUDE (end_time)
     WHERE status = 'published' AND deleted_at IS NULL;
 
+-- Event listing (EventService.list_events): live events ordered by start time,
+-- overall and per promoter, so a page (offset or keyset on start_time, id)
+-- is read straight off the index
+CREATE INDEX idx_events_live_start ON events(start_time DESC, id DESC)
+    WHERE deleted_at IS NULL;
+CREATE INDEX idx_events_promoter_start ON events(promoter_id, start_time DESC, id DESC)
+    WHERE deleted_at IS NULL;
+
+-- Filter combinations used by list_events / /events/my: a promoter's events
+-- by status, and the featured published listing
+CREATE INDEX idx_events_promoter_status_start
+    ON events(promoter_id, status, start_time DESC, id DESC)
+    WHERE deleted_at IS NULL;
+CREATE INDEX idx_events_featured_start ON events(start_time DESC, id DESC)
+    WHERE is_featured = true AND status = 'published' AND deleted_at IS NULL;
+
 -- ============================================================================
 -- MATERIALIZED VIEWS FOR ANALYTICS
 -- ============================================================================
@@ -12,9 +12,13 @@ Provides routes for:
 - POST /auth/email/verify - Verify email address
 """
 
+import orjson
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import ORJSONResponse, Response
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.core.config import settings
 from src.core.database import get_db
 from src.core.dependencies import (
     get_current_user,
@@ -30,15 +34,28 @@ from src.schemas.auth import (
     PasswordResetConfirm,
     EmailVerifyRequest,
     TokenResponse,
+    AccessTokenResponse,
+    UserTokenResponse,
 )
 from src.schemas.users import UserResponse, UserDetailResponse
-from src.schemas.common import SuccessResponse, ErrorResponse, ErrorDetail
+from src.schemas.common import MessageResponse, ErrorResponse, ErrorDetail
 from src.services.auth_service import AuthService
 
+# Built once at import: /me validates the ORM user and dumps it straight to
+# JSON bytes, with no intermediate dict or response-model re-validation
+_USER_DETAIL_ADAPTER = TypeAdapter(UserDetailResponse)
+
+# Static token response fields; the token endpoints return plain dicts so
+# no response model is built or re-validated per request
+_TOKEN_TYPE = "bearer"
+_TOKEN_EXPIRES_IN = settings.access_token_expire_minutes * 60
+
 # Create router with prefix and tags
 router = APIRouter(
     prefix="/auth",
     tags=["authentication"],
+    # Explicit so the router serializes with orjson wherever it is mounted
+    default_response_class=ORJSONResponse,
     responses={
         401: {"description": "Unauthorized - Invalid or missing token"},
         403: {"description": "Forbidden - Insufficient permissions"},
@@ -61,7 +78,7 @@ router = APIRouter(
 async def register(
     request: RegisterRequest,
     db: AsyncSession = Depends(get_db)
-) -> TokenResponse:
+) -> ORJSONResponse:
     """
     Register a new user account.
     
@@ -75,13 +92,18 @@ async def register(
     - `access_token`: JWT token for authenticated requests
     - `token_type`: Bearer
     - `expires_in`: Seconds until token expiration
+    - `user`: The new user's id, email, names and role
     """
     user, access_token = await AuthService.register(request, db)
     
-    return TokenResponse(
-        access_token=access_token,
-        token_type="bearer",
-        expires_in=30 * 60  # 30 minutes
+    return ORJSONResponse(
+        {
+            "access_token": access_token,
+            "token_type": _TOKEN_TYPE,
+            "expires_in": _TOKEN_EXPIRES_IN,
+            "user": UserTokenResponse.from_user(user).model_dump(mode="json"),
+        },
+        status_code=status.HTTP_201_CREATED,
     )
 
 
@@ -95,7 +117,7 @@ async def register(
 async def login(
     request: LoginRequest,
     db: AsyncSession = Depends(get_db)
-) -> TokenResponse:
+) -> ORJSONResponse:
     """
     Login with email and password.
     
@@ -108,20 +130,22 @@ async def login(
     - `refresh_token`: Token for getting new access tokens
     - `token_type`: Bearer
     - `expires_in`: Seconds until access token expiration
+    - `user`: The user's id, email, names and role
     """
     user, access_token, refresh_token = await AuthService.login(request, db)
     
-    return TokenResponse(
-        access_token=access_token,
-        refresh_token=refresh_token,
-        token_type="bearer",
-        expires_in=30 * 60  # 30 minutes
-    )
+    return ORJSONResponse({
+        "access_token": access_token,
+        "refresh_token": refresh_token,
+        "token_type": _TOKEN_TYPE,
+        "expires_in": _TOKEN_EXPIRES_IN,
+        "user": UserTokenResponse.from_user(user).model_dump(mode="json"),
+    })
 
 
 @router.post(
     "/refresh",
-    response_model=TokenResponse,
+    response_model=AccessTokenResponse,
     status_code=status.HTTP_200_OK,
     summary="Refresh access token",
     description="Get a new access token using a refresh token"
@@ -129,7 +153,7 @@ async def login(
 async def refresh(
     db: AsyncSession = Depends(get_db),
     refresh_token: str = Depends(get_refresh_token)
-) -> TokenResponse:
+) -> ORJSONResponse:
     """
     Get a new access token using a refresh token.
     
@@ -143,23 +167,23 @@ async def refresh(
     """
     new_access_token = await AuthService.refresh_access_token(refresh_token, db)
     
-    return TokenResponse(
-        access_token=new_access_token,
-        token_type="bearer",
-        expires_in=30 * 60  # 30 minutes
-    )
+    return ORJSONResponse({
+        "access_token": new_access_token,
+        "token_type": _TOKEN_TYPE,
+        "expires_in": _TOKEN_EXPIRES_IN,
+    })
 
 
 @router.post(
     "/logout",
-    response_model=SuccessResponse,
+    response_model=MessageResponse,
     status_code=status.HTTP_200_OK,
     summary="Logout user",
     description="Logout the current user (mainly for client-side cleanup)"
 )
 async def logout(
     current_user: User = Depends(get_current_user)
-) -> SuccessResponse:
+) -> Response:
     """
     Logout the current user.
     
@@ -169,13 +193,9 @@ async def logout(
     - Revoke tokens in database
     
     **Returns**:
-    - `success`: True
     - `message`: Logout confirmation
     """
-    return SuccessResponse(
-        success=True,
-        message="Successfully logged out"
-    )
+    return MessageResponse.as_response("Successfully logged out")
 
 
 # ============================================================================
@@ -191,7 +211,7 @@ async def logout(
 )
 async def get_current_user_profile(
     current_user: User = Depends(get_current_user)
-) -> UserDetailResponse:
+) -> Response:
     """
     Get the current authenticated user's profile.
     
@@ -200,8 +220,11 @@ async def get_current_user_profile(
     **Returns**:
     - Complete user profile including role, email verification status, etc.
     """
-    # Convert ORM model to schema
-    return UserDetailResponse.from_orm(current_user)
+    profile = _USER_DETAIL_ADAPTER.validate_python(current_user, from_attributes=True)
+    return Response(
+        content=_USER_DETAIL_ADAPTER.dump_json(profile),
+        media_type="application/json",
+    )
 
 
 # ============================================================================
@@ -210,7 +233,7 @@ async def get_current_user_profile(
 
 @router.post(
     "/password/change",
-    response_model=SuccessResponse,
+    response_model=MessageResponse,
     status_code=status.HTTP_200_OK,
     summary="Change password",
     description="Change password for the authenticated user"
@@ -219,7 +242,7 @@ async def change_password(
     request: PasswordChangeRequest,
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
-) -> SuccessResponse:
+) -> Response:
     """
     Change the password for the current user.
     
@@ -230,20 +253,16 @@ async def change_password(
     **Authorization**: Required - Bearer token
     
     **Returns**:
-    - `success`: True
     - `message`: Confirmation message
     """
     await AuthService.change_password(current_user, request, db)
     
-    return SuccessResponse(
-        success=True,
-        message="Password changed successfully"
-    )
+    return MessageResponse.as_response("Password changed successfully")
 
 
 @router.post(
     "/password/reset",
-    response_model=SuccessResponse,
+    response_model=MessageResponse,
     status_code=status.HTTP_200_OK,
     summary="Request password reset",
     description="Request a password reset email"
@@ -251,7 +270,7 @@ async def change_password(
 async def request_password_reset(
     request: PasswordResetRequest,
     db: AsyncSession = Depends(get_db)
-) -> SuccessResponse:
+) -> Response:
     """
     Request a password reset.
     
@@ -262,15 +281,13 @@ async def request_password_reset(
     Email will only be sent if account exists.
     
     **Returns**:
-    - `success`: True
     - `message`: Confirmation message
     """
     await AuthService.request_password_reset(request.email, db)
     
     # Always return success to prevent email enumeration
-    return SuccessResponse(
-        success=True,
-        message="If an account with that email exists, a reset link has been sent"
+    return MessageResponse.as_response(
+        "If an account with that email exists, a reset link has been sent"
     )
 
 
@@ -280,7 +297,7 @@ async def request_password_reset(
 
 @router.post(
     "/email/verify",
-    response_model=SuccessResponse,
+    response_model=MessageResponse,
     status_code=status.HTTP_200_OK,
     summary="Verify email address",
     description="Mark email as verified"
@@ -288,35 +305,38 @@ async def request_password_reset(
 async def verify_email(
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
-) -> SuccessResponse:
+) -> Response:
     """
     Verify the current user's email address.
     
     **Authorization**: Required - Bearer token
     
     **Returns**:
-    - `success`: True
     - `message`: Verification confirmation
     """
     await AuthService.verify_email(current_user, db)
     
-    return SuccessResponse(
-        success=True,
-        message="Email verified successfully"
-    )
+    return MessageResponse.as_response("Email verified successfully")
 
 
 # ============================================================================
 # Health Check
 # ============================================================================
 
+# Constant health payload, serialized once at import
+_AUTH_HEALTH_PAYLOAD = orjson.dumps({
+    "status": "healthy",
+    "service": "authentication"
+})
+
+
 @router.get(
     "/health",
     status_code=status.HTTP_200_OK,
     summary="Auth service health check",
     description="Check if authentication service is running"
 )
-async def auth_health() -> dict:
+async def auth_health() -> Response:
     """
     Quick health check for the authentication service.
     
@@ -324,7 +344,4 @@ async def auth_health() -> dict:
     - `status`: "healthy"
     - `service`: "authentication"
     """
-    return {
-        "status": "healthy",
-        "service": "authentication"
-    }
+    return Response(content=_AUTH_HEALTH_PAYLOAD, media_type="application/json")
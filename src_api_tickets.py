@@ -6,6 +6,8 @@ ticket operations, and ticket validation for event check-in.
 """
 
 from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi.responses import Response
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List, Optional
 
@@ -27,6 +29,11 @@ from src.schemas.tickets import (
 )
 
 
+# Built once at import: validates and dumps all of an event's tiers in one
+# call each instead of one model_validate() per tier
+_TIER_LIST_ADAPTER = TypeAdapter(list[TicketTierResponse])
+
+
 router = APIRouter(prefix="/tickets", tags=["Tickets"])
 
 
@@ -111,7 +118,11 @@ async def list_event_tiers(
         event_id=event_id,
         include_inactive=include_inactive
     )
-    return [TicketTierResponse.model_validate(tier) for tier in tiers]
+    tier_responses = _TIER_LIST_ADAPTER.validate_python(tiers, from_attributes=True)
+    return Response(
+        content=_TIER_LIST_ADAPTER.dump_json(tier_responses),
+        media_type="application/json",
+    )
 
 
 @router.get(
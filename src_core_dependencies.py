@@ -69,7 +69,7 @@ async def get_current_user(
     # Get user from database
     from sqlalchemy import select
     result = await db.execute(
-        select(User).where(User.id == int(token_payload.sub))
+        select(User).where(User.id == token_payload.sub)
     )
     user = result.scalars().first()
     
@@ -140,7 +140,7 @@ async def get_optional_user(
     
     from sqlalchemy import select
     result = await db.execute(
-        select(User).where(User.id == int(token_payload.sub))
+        select(User).where(User.id == token_payload.sub)
     )
     user = result.scalars().first()
     
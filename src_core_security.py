@@ -14,6 +14,8 @@ from jose import JWTError, jwt
 from passlib.context import CryptContext
 from pydantic import BaseModel
 
+from src.core.token_cache import cache_payload, evict_token, get_cached_payload
+
 # ============================================================================
 # Configuration
 # ============================================================================
@@ -38,7 +40,7 @@ REFRESH_TOKEN_EXPIRE_DAYS = int(os.getenv("REFRESH_TOKEN_EXPIRE_DAYS", 7))
 
 class TokenPayload(BaseModel):
     """JWT token payload structure."""
-    sub: str  # Subject (user_id)
+    sub: int  # Subject (user_id); the JWT's string claim is parsed once here
     exp: datetime  # Expiration time
     iat: datetime  # Issued at time
     type: str  # Token type: 'access' or 'refresh'
@@ -179,12 +181,18 @@ def verify_token(token: str) -> Optional[TokenPayload]:
     """
     Verify and decode a JWT token.
     
+    Verified payloads are served from the token cache when it is enabled.
+    
     Args:
         token: JWT token string to verify
         
     Returns:
         TokenPayload if token is valid, None if invalid or expired
     """
+    cached = get_cached_payload(token)
+    if cached is not None:
+        return cached
+    
     try:
         payload = jwt.decode(
             token,
@@ -204,10 +212,12 @@ def verify_token(token: str) -> Optional[TokenPayload]:
             type=payload.get("type", "access"),
             scopes=payload.get("scopes", [])
         )
+        cache_payload(token, token_payload)
         return token_payload
         
     except JWTError:
         # Token is invalid or expired
+        evict_token(token)
         return None
     except Exception:
         return None
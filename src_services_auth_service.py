@@ -23,6 +23,7 @@ from src.core.security import (
     verify_token,
     TokenPayload
 )
+from src.core.user_cache import invalidate_user
 from src.models.users import User, UserRole
 from src.schemas.auth import (
     RegisterRequest,
@@ -167,7 +168,7 @@ class AuthService:
         
         # Verify user still exists
         result = await db.execute(
-            select(User).where(User.id == int(token_payload.sub))
+            select(User).where(User.id == token_payload.sub)
         )
         user = result.scalars().first()
         
@@ -198,6 +199,9 @@ class AuthService:
         Raises:
             HTTPException: If old password is incorrect
         """
+        # The user may come from the user cache, which never holds the hash
+        await db.refresh(user, attribute_names=["password_hash"])
+        
         # Verify old password
         if not verify_password(request.old_password, user.password_hash):
             raise HTTPException(
@@ -218,6 +222,7 @@ class AuthService:
         
         db.add(user)
         await db.commit()
+        await invalidate_user(user.id)
     
     @staticmethod
     async def request_password_reset(
@@ -251,6 +256,7 @@ class AuthService:
             user.updated_at = datetime.utcnow()
             db.add(user)
             await db.commit()
+            await invalidate_user(user.id)
         
         # Always return success to prevent email enumeration
         return user
@@ -271,6 +277,7 @@ class AuthService:
             user.email_verified_at = datetime.utcnow()
             db.add(user)
             await db.commit()
+            await invalidate_user(user.id)
 
 
 # ============================================================================
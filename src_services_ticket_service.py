@@ -16,6 +16,7 @@ import qrcode
 from io import BytesIO
 import base64
 
+from src.core.event_cache import invalidate_event
 from src.models.events import Event, TicketTier
 from src.models.tickets import Ticket
 from src.models.users import User
@@ -104,6 +105,7 @@ class TicketService:
 
         self.db.add(tier)
         await self.db.commit()
+        await invalidate_event(tier.event_id)
         await self.db.refresh(tier)
 
         return tier
@@ -215,12 +217,17 @@ class TicketService:
 
         # Update fields
         update_data = tier_data.model_dump(exclude_unset=True)
+        if not update_data:
+            # Empty PATCH: nothing to write or invalidate
+            return tier
+
         for field, value in update_data.items():
             setattr(tier, field, value)
 
         tier.updated_at = datetime.now(timezone.utc)
 
         await self.db.commit()
+        await invalidate_event(tier.event_id)
         await self.db.refresh(tier)
 
         return tier
@@ -266,6 +273,7 @@ class TicketService:
 
         await self.db.delete(tier)
         await self.db.commit()
+        await invalidate_event(tier.event_id)
 
     async def get_tier_availability(
         self,
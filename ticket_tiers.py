@@ -16,6 +16,7 @@ from sqlalchemy import (
     Text,
 )
 from sqlalchemy.dialects.postgresql import JSONB, UUID
+from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql import func
 import uuid as uuid_lib
@@ -49,8 +50,8 @@ class TicketTier(Base):
     name: Mapped[str] = mapped_column(String(100), nullable=False)
     description: Mapped[str | None] = mapped_column(Text)
 
-    # Pricing
-    price: Mapped[float] = mapped_column(Numeric(10, 2), nullable=False)
+    # Pricing (loaded as float, matching the annotation and the schemas)
+    price: Mapped[float] = mapped_column(Numeric(10, 2, asdecimal=False), nullable=False)
 
     # Inventory
     quantity: Mapped[int] = mapped_column(Integer, nullable=False)
@@ -72,8 +73,13 @@ class TicketTier(Base):
     is_active: Mapped[bool] = mapped_column(Boolean, default=True, index=True)
     requires_approval: Mapped[bool] = mapped_column(Boolean, default=False)
 
-    # Metadata
-    metadata: Mapped[dict] = mapped_column(JSONB, default={})
+    # Metadata (``metadata`` is reserved by the declarative base, so the
+    # attribute is renamed while the column keeps its name). Deferred: no
+    # tier response includes it, and tiers are loaded with every event page;
+    # opt in with .options(undefer(TicketTier.tier_metadata))
+    tier_metadata: Mapped[dict] = mapped_column(
+        "metadata", JSONB, default=dict, deferred=True
+    )
 
     # Timestamps
     created_at: Mapped[datetime] = mapped_column(
@@ -108,12 +114,17 @@ class TicketTier(Base):
     def __repr__(self) -> str:
         return f"<TicketTier(id={self.id}, name={self.name}, price={self.price})>"
 
-    @property
+    @hybrid_property
     def available(self) -> int:
-        """Get number of tickets available for purchase."""
+        """
+        Get number of tickets available for purchase.
+
+        Also usable in queries (e.g. ``where(TicketTier.available > 0)``),
+        where it compiles to ``quantity - sold - reserved``.
+        """
         return self.quantity - self.sold - self.reserved
 
-    @property
+    @hybrid_property
     def is_sold_out(self) -> bool:
         """Check if tier is sold out."""
         return self.available <= 0
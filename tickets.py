@@ -2,11 +2,20 @@
 Ticket tier and individual ticket schemas.
 """
 
-from pydantic import BaseModel, Field, validator
+from pydantic import (
+    AwareDatetime,
+    BaseModel,
+    ConfigDict,
+    Field,
+    ValidationInfo,
+    field_validator,
+)
 from datetime import datetime
 from typing import Optional
 from enum import Enum
 
+from src.schemas.common import ORM_RESPONSE_CONFIG
+
 
 class TicketStatus(str, Enum):
     """Ticket status enumeration."""
@@ -17,6 +26,18 @@ class TicketStatus(str, Enum):
     REFUNDED = "refunded"
 
 
+_CREATE_TICKET_TIER_REQUEST_EXAMPLE = {
+    "name": "General Admission",
+    "description": "General admission to the event",
+    "price": 49.99,
+    "quantity": 1000,
+    "min_purchase": 1,
+    "max_purchase": 10,
+    "sale_start_time": "2025-10-26T00:00:00Z",
+    "sale_end_time": "2025-07-14T23:59:59Z"
+}
+
+
 class CreateTicketTierRequest(BaseModel):
     """Create ticket tier request schema."""
 
@@ -56,11 +77,13 @@ class CreateTicketTierRequest(BaseModel):
         ge=0,
         description="Display order position"
     )
-    sale_start_time: Optional[datetime] = Field(
+    # Parsed by pydantic-core (``Z`` and ``±HH:MM`` offsets alike); naive
+    # times are rejected so the window check never compares naive to aware
+    sale_start_time: Optional[AwareDatetime] = Field(
         default=None,
         description="When ticket sales begin"
     )
-    sale_end_time: Optional[datetime] = Field(
+    sale_end_time: Optional[AwareDatetime] = Field(
         default=None,
         description="When ticket sales end"
     )
@@ -73,35 +96,35 @@ class CreateTicketTierRequest(BaseModel):
         description="Whether purchases require approval"
     )
 
-    @validator("max_purchase")
-    def max_gte_min(cls, v, values):
+    @field_validator("max_purchase")
+    @classmethod
+    def max_gte_min(cls, v: int, info: ValidationInfo) -> int:
         """Validate max_purchase >= min_purchase."""
-        if "min_purchase" in values and v < values["min_purchase"]:
+        if "min_purchase" in info.data and v < info.data["min_purchase"]:
             raise ValueError("max_purchase must be >= min_purchase")
         return v
 
-    @validator("sale_end_time")
-    def end_after_start(cls, v, values):
+    @field_validator("sale_end_time")
+    @classmethod
+    def end_after_start(
+        cls, v: Optional[datetime], info: ValidationInfo
+    ) -> Optional[datetime]:
         """Validate sale_end_time > sale_start_time."""
-        if v is not None and "sale_start_time" in values:
-            if values["sale_start_time"] is not None and v <= values["sale_start_time"]:
+        if v is not None and "sale_start_time" in info.data:
+            start = info.data["sale_start_time"]
+            if start is not None and v <= start:
                 raise ValueError("sale_end_time must be after sale_start_time")
         return v
 
-    class Config:
-        """Pydantic configuration."""
-        schema_extra = {
-            "example": {
-                "name": "General Admission",
-                "description": "General admission to the event",
-                "price": 49.99,
-                "quantity": 1000,
-                "min_purchase": 1,
-                "max_purchase": 10,
-                "sale_start_time": "2025-10-26T00:00:00Z",
-                "sale_end_time": "2025-07-14T23:59:59Z"
-            }
-        }
+    model_config = ConfigDict(
+        json_schema_extra={"example": _CREATE_TICKET_TIER_REQUEST_EXAMPLE}
+    )
+
+
+_UPDATE_TICKET_TIER_REQUEST_EXAMPLE = {
+    "quantity": 500,
+    "is_active": False
+}
 
 
 class UpdateTicketTierRequest(BaseModel):
@@ -119,19 +142,30 @@ class UpdateTicketTierRequest(BaseModel):
     min_purchase: Optional[int] = Field(default=None, ge=1, le=1000, description="Min purchase")
     max_purchase: Optional[int] = Field(default=None, ge=1, le=1000, description="Max purchase")
     position: Optional[int] = Field(default=None, ge=0, description="Position")
-    sale_start_time: Optional[datetime] = Field(default=None, description="Sale start time")
-    sale_end_time: Optional[datetime] = Field(default=None, description="Sale end time")
+    sale_start_time: Optional[AwareDatetime] = Field(default=None, description="Sale start time")
+    sale_end_time: Optional[AwareDatetime] = Field(default=None, description="Sale end time")
     is_active: Optional[bool] = Field(default=None, description="Is active")
     requires_approval: Optional[bool] = Field(default=None, description="Requires approval")
 
-    class Config:
-        """Pydantic configuration."""
-        schema_extra = {
-            "example": {
-                "quantity": 500,
-                "is_active": False
-            }
-        }
+    model_config = ConfigDict(
+        json_schema_extra={"example": _UPDATE_TICKET_TIER_REQUEST_EXAMPLE}
+    )
+
+
+_TICKET_TIER_RESPONSE_EXAMPLE = {
+    "id": 1,
+    "uuid": "550e8400-e29b-41d4-a716-446655440000",
+    "event_id": 1,
+    "name": "General Admission",
+    "price": 49.99,
+    "quantity": 1000,
+    "sold": 500,
+    "reserved": 100,
+    "available": 400,
+    "is_active": True,
+    "is_sold_out": False,
+    "percent_sold": 50.0
+}
 
 
 class TicketTierResponse(BaseModel):
@@ -159,25 +193,23 @@ class TicketTierResponse(BaseModel):
     created_at: datetime = Field(description="Creation timestamp")
     updated_at: datetime = Field(description="Last update timestamp")
 
-    class Config:
-        """Pydantic configuration."""
-        from_attributes = True
-        schema_extra = {
-            "example": {
-                "id": 1,
-                "uuid": "550e8400-e29b-41d4-a716-446655440000",
-                "event_id": 1,
-                "name": "General Admission",
-                "price": 49.99,
-                "quantity": 1000,
-                "sold": 500,
-                "reserved": 100,
-                "available": 400,
-                "is_active": True,
-                "is_sold_out": False,
-                "percent_sold": 50.0
-            }
-        }
+    model_config = ConfigDict(
+        **ORM_RESPONSE_CONFIG,
+        json_schema_extra={"example": _TICKET_TIER_RESPONSE_EXAMPLE}
+    )
+
+
+_TICKET_TIER_AVAILABILITY_RESPONSE_EXAMPLE = {
+    "tier_id": 1,
+    "tier_name": "General Admission",
+    "price": 49.99,
+    "available": 400,
+    "sold": 500,
+    "quantity": 1000,
+    "is_sold_out": False,
+    "is_on_sale": True,
+    "can_purchase": True
+}
 
 
 class TicketTierAvailabilityResponse(BaseModel):
@@ -194,21 +226,9 @@ class TicketTierAvailabilityResponse(BaseModel):
     can_purchase: bool = Field(description="Can purchase right now")
     message: Optional[str] = Field(default=None, description="Status message")
 
-    class Config:
-        """Pydantic configuration."""
-        schema_extra = {
-            "example": {
-                "tier_id": 1,
-                "tier_name": "General Admission",
-                "price": 49.99,
-                "available": 400,
-                "sold": 500,
-                "quantity": 1000,
-                "is_sold_out": False,
-                "is_on_sale": True,
-                "can_purchase": True
-            }
-        }
+    model_config = ConfigDict(
+        json_schema_extra={"example": _TICKET_TIER_AVAILABILITY_RESPONSE_EXAMPLE}
+    )
 
 
 class TicketResponse(BaseModel):
@@ -230,9 +250,7 @@ class TicketResponse(BaseModel):
     created_at: datetime = Field(description="Creation timestamp")
     updated_at: datetime = Field(description="Last update timestamp")
 
-    class Config:
-        """Pydantic configuration."""
-        from_attributes = True
+    model_config = ORM_RESPONSE_CONFIG
 
 
 class TicketDetailResponse(BaseModel):
@@ -253,9 +271,7 @@ class TicketDetailResponse(BaseModel):
     created_at: datetime = Field(description="Creation timestamp")
     updated_at: datetime = Field(description="Last update timestamp")
 
-    class Config:
-        """Pydantic configuration."""
-        from_attributes = True
+    model_config = ORM_RESPONSE_CONFIG
 
 
 class EventTicketInfo(BaseModel):
@@ -268,9 +284,14 @@ class EventTicketInfo(BaseModel):
     venue_name: str = Field(description="Venue name")
     venue_city: Optional[str] = Field(default=None, description="Venue city")
 
-    class Config:
-        """Pydantic configuration."""
-        from_attributes = True
+    model_config = ORM_RESPONSE_CONFIG
+
+
+_SET_ATTENDEE_REQUEST_EXAMPLE = {
+    "first_name": "John",
+    "last_name": "Doe",
+    "email": "john@example.com"
+}
 
 
 class SetAttendeeRequest(BaseModel):
@@ -288,15 +309,15 @@ class SetAttendeeRequest(BaseModel):
     )
     email: str = Field(description="Attendee email")
 
-    class Config:
-        """Pydantic configuration."""
-        schema_extra = {
-            "example": {
-                "first_name": "John",
-                "last_name": "Doe",
-                "email": "john@example.com"
-            }
-        }
+    model_config = ConfigDict(
+        json_schema_extra={"example": _SET_ATTENDEE_REQUEST_EXAMPLE}
+    )
+
+
+_TRANSFER_TICKET_REQUEST_EXAMPLE = {
+    "recipient_email": "friend@example.com",
+    "message": "Enjoy the show!"
+}
 
 
 class TransferTicketRequest(BaseModel):
@@ -309,14 +330,14 @@ class TransferTicketRequest(BaseModel):
         description="Optional transfer message"
     )
 
-    class Config:
-        """Pydantic configuration."""
-        schema_extra = {
-            "example": {
-                "recipient_email": "friend@example.com",
-                "message": "Enjoy the show!"
-            }
-        }
+    model_config = ConfigDict(
+        json_schema_extra={"example": _TRANSFER_TICKET_REQUEST_EXAMPLE}
+    )
+
+
+_VALIDATE_TICKET_REQUEST_EXAMPLE = {
+    "ticket_code": "TK-2025-001-000001"
+}
 
 
 class ValidateTicketRequest(BaseModel):
@@ -324,13 +345,20 @@ class ValidateTicketRequest(BaseModel):
 
     ticket_code: str = Field(description="Ticket code to validate")
 
-    class Config:
-        """Pydantic configuration."""
-        schema_extra = {
-            "example": {
-                "ticket_code": "TK-2025-001-000001"
-            }
-        }
+    model_config = ConfigDict(
+        json_schema_extra={"example": _VALIDATE_TICKET_REQUEST_EXAMPLE}
+    )
+
+
+_VALIDATE_TICKET_RESPONSE_EXAMPLE = {
+    "valid": True,
+    "message": "Ticket is valid and ready for check-in",
+    "ticket": {
+        "id": 1,
+        "ticket_code": "TK-2025-001-000001",
+        "status": "valid"
+    }
+}
 
 
 class ValidateTicketResponse(BaseModel):
@@ -340,19 +368,9 @@ class ValidateTicketResponse(BaseModel):
     message: str = Field(description="Validation message")
     ticket: Optional[TicketResponse] = Field(default=None, description="Ticket details if valid")
 
-    class Config:
-        """Pydantic configuration."""
-        schema_extra = {
-            "example": {
-                "valid": True,
-                "message": "Ticket is valid and ready for check-in",
-                "ticket": {
-                    "id": 1,
-                    "ticket_code": "TK-2025-001-000001",
-                    "status": "valid"
-                }
-            }
-        }
+    model_config = ConfigDict(
+        json_schema_extra={"example": _VALIDATE_TICKET_RESPONSE_EXAMPLE}
+    )
 
 
 # Update forward references
@@ -0,0 +1,78 @@
+"""
+In-process cache of verified JWT payloads.
+
+Repeated requests carrying the same token skip signature verification and
+payload parsing. Entries are keyed by a SHA-256 digest of the raw token,
+live for at most ``token_cache_ttl_seconds`` and are never returned past
+the token's own expiry. Disabled unless ``token_cache_enabled`` is set.
+"""
+
+import hashlib
+import threading
+from datetime import datetime
+from typing import TYPE_CHECKING, Optional
+
+from cachetools import TTLCache
+
+from src.core.config import settings
+
+if TYPE_CHECKING:
+    from src.core.security import TokenPayload
+
+
+_cache: TTLCache = TTLCache(
+    maxsize=settings.token_cache_maxsize,
+    ttl=settings.token_cache_ttl_seconds,
+)
+_lock = threading.Lock()
+
+
+def _key(token: str) -> bytes:
+    """Cache key for a raw token."""
+    return hashlib.sha256(token.encode()).digest()
+
+
+def get_cached_payload(token: str) -> Optional["TokenPayload"]:
+    """
+    Get the cached payload for a token.
+
+    Returns:
+        TokenPayload if cached and not yet expired, None otherwise
+    """
+    if not settings.token_cache_enabled:
+        return None
+
+    key = _key(token)
+    with _lock:
+        payload = _cache.get(key)
+        if payload is None:
+            return None
+        # exp is a naive local datetime (see security.verify_token)
+        if payload.exp <= datetime.now():
+            _cache.pop(key, None)
+            return None
+    return payload
+
+
+def cache_payload(token: str, payload: "TokenPayload") -> None:
+    """Store a verified token payload."""
+    if not settings.token_cache_enabled:
+        return
+
+    with _lock:
+        _cache[_key(token)] = payload
+
+
+def evict_token(token: str) -> None:
+    """Remove a token from the cache (e.g. after a verification failure)."""
+    if not settings.token_cache_enabled:
+        return
+
+    with _lock:
+        _cache.pop(_key(token), None)
+
+
+def clear_token_cache() -> None:
+    """Remove all cached payloads."""
+    with _lock:
+        _cache.clear()
@@ -0,0 +1,165 @@
+"""
+Redis cache of authenticated users.
+
+Stores the columns the auth dependencies and ``/auth/me`` read from a
+User (and its Promoter, if any) under ``user:{id}`` so they can skip the
+per-request user SELECT. Credentials and payment details are never
+cached; handlers that need them load them with
+``db.refresh(user, attribute_names=[...])``. Cached rows are attached to
+the request's session with ``merge(load=False)``, so handlers get a
+normal persistent User that can be modified and committed. Redis errors
+fall back to the database.
+
+Every write to a user or promoter must call ``invalidate_user`` after
+commit. Any write that does not is visible to authentication (role,
+is_active, deleted_at, promoter verification) only once the entry
+expires, up to ``user_cache_ttl_seconds`` later.
+"""
+
+import uuid
+from datetime import datetime
+from decimal import Decimal
+from typing import Any, Optional, TypeVar
+
+import orjson
+from redis.exceptions import RedisError
+from sqlalchemy import DateTime, Enum, Numeric, Uuid
+from sqlalchemy import inspect as sa_inspect
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import make_transient_to_detached
+from sqlalchemy.orm.attributes import set_committed_value
+
+from src.core.cache import get_redis
+from src.core.config import settings
+from src.models.promoters import Promoter
+from src.models.users import User
+
+ModelT = TypeVar("ModelT")
+
+# Columns that are cached; anything else is left unloaded on a cache hit
+_USER_FIELDS = (
+    "id",
+    "uuid",
+    "email",
+    "first_name",
+    "last_name",
+    "phone",
+    "role",
+    "is_active",
+    "email_verified",
+    "email_verified_at",
+    "deleted_at",
+    "last_login_at",
+    "created_at",
+    "updated_at",
+)
+_PROMOTER_FIELDS = (
+    "id",
+    "user_id",
+    "company_name",
+    "company_website",
+    "description",
+    "logo_url",
+    "verification_status",
+    "verified_at",
+    "created_at",
+    "updated_at",
+)
+
+
+def _key(user_id: int) -> str:
+    return f"user:{user_id}"
+
+
+def _to_dict(obj: Any, fields: tuple[str, ...]) -> dict[str, Any]:
+    """Whitelisted column values of a mapped instance."""
+    column_attrs = sa_inspect(obj).mapper.column_attrs
+    return {key: getattr(obj, key) for key in fields if key in column_attrs}
+
+
+def _from_dict(
+    model: type[ModelT], data: dict[str, Any], fields: tuple[str, ...]
+) -> ModelT:
+    """Rebuild a detached, clean instance from cached column values."""
+    values = {}
+    for attr in sa_inspect(model).column_attrs:
+        if attr.key not in fields or attr.key not in data:
+            continue
+        value = data[attr.key]
+        if value is not None:
+            column_type = attr.columns[0].type
+            if isinstance(column_type, DateTime):
+                value = datetime.fromisoformat(value)
+            elif isinstance(column_type, Enum) and column_type.enum_class:
+                value = column_type.enum_class(value)
+            elif isinstance(column_type, Uuid):
+                value = uuid.UUID(value)
+            elif isinstance(column_type, Numeric) and column_type.asdecimal:
+                value = Decimal(value)
+        values[attr.key] = value
+
+    obj = model(**values)
+    make_transient_to_detached(obj)
+    return obj
+
+
+async def get_cached_user(db: AsyncSession, user_id: int) -> Optional[User]:
+    """
+    Get a user (with promoter loaded) from the cache.
+
+    Returns:
+        User attached to ``db`` on a cache hit, None on a miss or error
+    """
+    if not settings.user_cache_enabled:
+        return None
+
+    try:
+        raw = await get_redis().get(_key(user_id))
+    except RedisError:
+        return None
+    if raw is None:
+        return None
+
+    data = orjson.loads(raw)
+    user = await db.merge(_from_dict(User, data["user"], _USER_FIELDS), load=False)
+    promoter = None
+    if data["promoter"] is not None:
+        promoter = await db.merge(
+            _from_dict(Promoter, data["promoter"], _PROMOTER_FIELDS), load=False
+        )
+        set_committed_value(promoter, "user", user)
+    set_committed_value(user, "promoter", promoter)
+    return user
+
+
+async def cache_user(user: User) -> None:
+    """Cache a user whose promoter relationship is already loaded."""
+    if not settings.user_cache_enabled:
+        return
+
+    payload = orjson.dumps(
+        {
+            "user": _to_dict(user, _USER_FIELDS),
+            "promoter": (
+                _to_dict(user.promoter, _PROMOTER_FIELDS) if user.promoter else None
+            ),
+        },
+        default=str,  # UUID
+    )
+    try:
+        await get_redis().set(
+            _key(user.id), payload, ex=settings.user_cache_ttl_seconds
+        )
+    except RedisError:
+        pass
+
+
+async def invalidate_user(user_id: int) -> None:
+    """Drop a cached user after it (or its promoter) has been modified."""
+    if not settings.user_cache_enabled:
+        return
+
+    try:
+        await get_redis().delete(_key(user_id))
+    except RedisError:
+        pass
@@ -2,11 +2,13 @@
 User schemas for user management and CRUD operations.
 """
 
-from pydantic import BaseModel, Field, EmailStr, validator
+from pydantic import BaseModel, ConfigDict, Field, EmailStr
 from datetime import datetime
 from typing import Optional
 from enum import Enum
 
+from src.schemas.common import ORM_RESPONSE_CONFIG, HttpUrlStr
+
 
 class UserRole(str, Enum):
     """User role enumeration."""
@@ -16,6 +18,15 @@ class UserRole(str, Enum):
     ADMIN = "admin"
 
 
+_USER_CREATE_EXAMPLE = {
+    "email": "john@example.com",
+    "password": "SecurePass123!",
+    "first_name": "John",
+    "last_name": "Doe",
+    "phone": "+1234567890"
+}
+
+
 class UserCreate(BaseModel):
     """Create user request schema."""
 
@@ -41,17 +52,13 @@ class UserCreate(BaseModel):
         description="Phone number (optional)"
     )
 
-    class Config:
-        """Pydantic configuration."""
-        schema_extra = {
-            "example": {
-                "email": "john@example.com",
-                "password": "SecurePass123!",
-                "first_name": "John",
-                "last_name": "Doe",
-                "phone": "+1234567890"
-            }
-        }
+    model_config = ConfigDict(json_schema_extra={"example": _USER_CREATE_EXAMPLE})
+
+
+_USER_UPDATE_EXAMPLE = {
+    "first_name": "Jane",
+    "phone": "+1234567890"
+}
 
 
 class UserUpdate(BaseModel):
@@ -75,14 +82,23 @@ class UserUpdate(BaseModel):
         description="Phone number"
     )
 
-    class Config:
-        """Pydantic configuration."""
-        schema_extra = {
-            "example": {
-                "first_name": "Jane",
-                "phone": "+1234567890"
-            }
-        }
+    model_config = ConfigDict(json_schema_extra={"example": _USER_UPDATE_EXAMPLE})
+
+
+_USER_RESPONSE_EXAMPLE = {
+    "id": 1,
+    "uuid": "550e8400-e29b-41d4-a716-446655440000",
+    "email": "john@example.com",
+    "first_name": "John",
+    "last_name": "Doe",
+    "phone": "+1234567890",
+    "role": "user",
+    "email_verified": True,
+    "is_active": True,
+    "created_at": "2025-10-26T10:00:00Z",
+    "updated_at": "2025-10-26T10:00:00Z",
+    "last_login_at": "2025-10-26T11:30:00Z"
+}
 
 
 class UserResponse(BaseModel):
@@ -101,51 +117,20 @@ class UserResponse(BaseModel):
     updated_at: datetime = Field(description="Last update timestamp")
     last_login_at: Optional[datetime] = Field(default=None, description="Last login timestamp")
 
-    class Config:
-        """Pydantic configuration."""
-        from_attributes = True
-        schema_extra = {
-            "example": {
-                "id": 1,
-                "uuid": "550e8400-e29b-41d4-a716-446655440000",
-                "email": "john@example.com",
-                "first_name": "John",
-                "last_name": "Doe",
-                "phone": "+1234567890",
-                "role": "user",
-                "email_verified": True,
-                "is_active": True,
-                "created_at": "2025-10-26T10:00:00Z",
-                "updated_at": "2025-10-26T10:00:00Z",
-                "last_login_at": "2025-10-26T11:30:00Z"
-            }
-        }
-
-
-class UserDetailResponse(BaseModel):
+    model_config = ConfigDict(
+        **ORM_RESPONSE_CONFIG,
+        json_schema_extra={"example": _USER_RESPONSE_EXAMPLE}
+    )
+
+
+class UserDetailResponse(UserResponse):
     """Detailed user response schema."""
 
-    id: int = Field(description="User ID")
-    uuid: str = Field(description="User UUID")
-    email: str = Field(description="Email address")
-    first_name: str = Field(description="First name")
-    last_name: str = Field(description="Last name")
-    phone: Optional[str] = Field(default=None, description="Phone number")
-    role: str = Field(description="User role")
-    email_verified: bool = Field(description="Email verification status")
-    is_active: bool = Field(description="Account active status")
-    created_at: datetime = Field(description="Account creation timestamp")
-    updated_at: datetime = Field(description="Last update timestamp")
-    last_login_at: Optional[datetime] = Field(default=None, description="Last login timestamp")
     promoter: Optional["PromoterDetailResponse"] = Field(
         default=None,
         description="Promoter information if user is a promoter"
     )
 
-    class Config:
-        """Pydantic configuration."""
-        from_attributes = True
-
 
 class PromoterDetailResponse(BaseModel):
     """Promoter detail response schema."""
@@ -158,9 +143,20 @@ class PromoterDetailResponse(BaseModel):
     verification_status: str = Field(description="Verification status (pending, verified, rejected)")
     verified_at: Optional[datetime] = Field(default=None, description="Verification timestamp")
 
-    class Config:
-        """Pydantic configuration."""
-        from_attributes = True
+    model_config = ORM_RESPONSE_CONFIG
+
+
+_BECOME_PROMOTER_REQUEST_EXAMPLE = {
+    "company_name": "Amazing Events Inc",
+    "company_website": "https://amazingevents.com",
+    "description": "We organize amazing events!",
+    "address_line1": "123 Main St",
+    "city": "New York",
+    "state": "NY",
+    "postal_code": "10001",
+    "country": "US",
+    "tax_id": "12-3456789"
+}
 
 
 class BecomePromoterRequest(BaseModel):
@@ -171,7 +167,7 @@ class BecomePromoterRequest(BaseModel):
         max_length=255,
         description="Company name"
     )
-    company_website: Optional[str] = Field(
+    company_website: Optional[HttpUrlStr] = Field(
         default=None,
         max_length=255,
         description="Company website URL"
@@ -216,21 +212,9 @@ class BecomePromoterRequest(BaseModel):
         description="Tax ID"
     )
 
-    class Config:
-        """Pydantic configuration."""
-        schema_extra = {
-            "example": {
-                "company_name": "Amazing Events Inc",
-                "company_website": "https://amazingevents.com",
-                "description": "We organize amazing events!",
-                "address_line1": "123 Main St",
-                "city": "New York",
-                "state": "NY",
-                "postal_code": "10001",
-                "country": "US",
-                "tax_id": "12-3456789"
-            }
-        }
+    model_config = ConfigDict(
+        json_schema_extra={"example": _BECOME_PROMOTER_REQUEST_EXAMPLE}
+    )
 
 
 class PromoterResponse(BaseModel):
@@ -247,9 +231,7 @@ class PromoterResponse(BaseModel):
     created_at: datetime = Field(description="Creation timestamp")
     updated_at: datetime = Field(description="Last update timestamp")
 
-    class Config:
-        """Pydantic configuration."""
-        from_attributes = True
+    model_config = ORM_RESPONSE_CONFIG
 
 
 class UserListResponse(BaseModel):
@@ -264,9 +246,14 @@ class UserListResponse(BaseModel):
     is_active: bool = Field(description="Account active status")
     created_at: datetime = Field(description="Account creation timestamp")
 
-    class Config:
-        """Pydantic configuration."""
-        from_attributes = True
+    model_config = ORM_RESPONSE_CONFIG
+
+
+_USER_PREFERENCES_UPDATE_EXAMPLE = {
+    "email_notifications": True,
+    "marketing_emails": False,
+    "two_factor_enabled": True
+}
 
 
 class UserPreferencesUpdate(BaseModel):
@@ -285,15 +272,9 @@ class UserPreferencesUpdate(BaseModel):
         description="Enable two-factor authentication"
     )
 
-    class Config:
-        """Pydantic configuration."""
-        schema_extra = {
-            "example": {
-                "email_notifications": True,
-                "marketing_emails": False,
-                "two_factor_enabled": True
-            }
-        }
+    model_config = ConfigDict(
+        json_schema_extra={"example": _USER_PREFERENCES_UPDATE_EXAMPLE}
+    )
 
 
 # Update forward references
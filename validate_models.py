@@ -5,7 +5,8 @@ This script:
 1. Imports all models
 2. Checks relationships
 3. Verifies table definitions
-4. Reports any issues
+4. Flags columns with shared mutable defaults
+5. Reports any issues
 """
 
 import sys
@@ -81,6 +82,25 @@ def validate_models():
             if relationships:
                 print(f"   • {model_name:20} → {', '.join(relationships)}")
 
+        # Check column defaults: a literal ``{}``/``[]`` default is one object
+        # shared by every row inserted, so JSONB defaults must be callables
+        print(f"\n🧩 Column Defaults:")
+
+        shared_defaults = [
+            f"{table_name}.{column.name}"
+            for table_name, table in Base.metadata.tables.items()
+            for column in table.columns
+            if column.default is not None
+            and not column.default.is_callable
+            and isinstance(column.default.arg, (dict, list, set))
+        ]
+        for name in shared_defaults:
+            print(f"   ❌ {name} uses a shared mutable default (use default=dict)")
+        if shared_defaults:
+            print("\n❌ VALIDATION FAILED")
+            return False
+        print("   • No shared mutable defaults")
+
         # Summary
         print("\n" + "=" * 60)
         print("✅ VALIDATION SUCCESSFUL")
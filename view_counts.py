@@ -0,0 +1,173 @@
+"""
+Buffered event view counts.
+
+GET /events/{id} records a view with one HINCRBY on the ``event:views``
+Redis hash instead of an UPDATE per page view. When Redis is disabled or
+unavailable the view is counted in an in-process dict instead. A
+background task started in the app lifespan moves both buffers into
+Postgres with a single bulk UPDATE each: the in-process buffer every
+``view_count_local_flush_interval_seconds`` and the Redis hash every
+``view_count_flush_interval_seconds``.
+
+A Redis flush reads the hash, commits the UPDATE, then subtracts exactly
+what it applied, so views recorded meanwhile stay in the hash for the
+next flush.
+"""
+
+import asyncio
+import logging
+import secrets
+from collections import defaultdict
+from typing import Optional
+
+from redis.exceptions import RedisError
+
+from src.core.cache import get_redis
+from src.core.config import settings
+from src.core.database import async_session_maker
+from src.services.event_service import EventService
+
+logger = logging.getLogger(__name__)
+
+_PENDING_KEY = "event:views"
+# Only one process flushes at a time; the value is the holder's token
+_LOCK_KEY = "event:views:lock"
+
+# Delete the lock only if this flusher still holds it
+_RELEASE_LOCK_SCRIPT = """
+if redis.call("GET", KEYS[1]) == ARGV[1] then
+    return redis.call("DEL", KEYS[1])
+end
+return 0
+"""
+
+# Subtract applied deltas (ARGV: id, count, id, count, ...) and drop
+# fields that reach zero
+_SUBTRACT_DELTAS_SCRIPT = """
+for i = 1, #ARGV, 2 do
+    if redis.call("HINCRBY", KEYS[1], ARGV[i], -tonumber(ARGV[i + 1])) <= 0 then
+        redis.call("HDEL", KEYS[1], ARGV[i])
+    end
+end
+return 0
+"""
+
+# Views counted in this process while Redis is unavailable
+_local_deltas: defaultdict[int, int] = defaultdict(int)
+
+_flusher: Optional[asyncio.Task] = None
+
+
+async def record_view(event_id: int) -> None:
+    """Buffer one view of an event (Redis, or in-process as a fallback)."""
+    if settings.view_count_buffer_enabled:
+        try:
+            await get_redis().hincrby(_PENDING_KEY, str(event_id), 1)
+            return
+        except RedisError:
+            pass
+
+    _local_deltas[event_id] += 1
+
+
+async def _apply_deltas(deltas: dict[int, int]) -> None:
+    async with async_session_maker() as session:
+        await EventService(session).apply_view_deltas(deltas)
+
+
+async def flush_local_view_counts() -> int:
+    """
+    Apply views buffered in this process to the events table.
+
+    Returns:
+        Number of events updated
+    """
+    global _local_deltas
+    if not _local_deltas:
+        return 0
+
+    # Swap the buffer out before awaiting so new views go to a fresh dict
+    deltas, _local_deltas = _local_deltas, defaultdict(int)
+    try:
+        await _apply_deltas(deltas)
+    except Exception:
+        # Put the views back for the next attempt
+        for event_id, count in deltas.items():
+            _local_deltas[event_id] += count
+        raise
+    return len(deltas)
+
+
+async def flush_view_counts() -> int:
+    """
+    Apply views buffered in Redis to the events table.
+
+    Returns:
+        Number of events updated
+    """
+    redis = get_redis()
+    token = secrets.token_hex(16)
+    if not await redis.set(
+        _LOCK_KEY, token, nx=True, ex=settings.view_count_flush_lock_ttl_seconds
+    ):
+        return 0
+
+    try:
+        pending = await redis.hgetall(_PENDING_KEY)
+        deltas = {int(event_id): int(count) for event_id, count in pending.items()}
+        if not deltas:
+            return 0
+
+        await _apply_deltas(deltas)
+
+        args = [part for item in deltas.items() for part in item]
+        await redis.eval(_SUBTRACT_DELTAS_SCRIPT, 1, _PENDING_KEY, *args)
+        return len(deltas)
+    finally:
+        await redis.eval(_RELEASE_LOCK_SCRIPT, 1, _LOCK_KEY, token)
+
+
+async def _flush_all() -> None:
+    await flush_local_view_counts()
+    if settings.view_count_buffer_enabled:
+        await flush_view_counts()
+
+
+async def _run_flusher() -> None:
+    loop = asyncio.get_running_loop()
+    next_redis_flush = loop.time() + settings.view_count_flush_interval_seconds
+    while True:
+        await asyncio.sleep(settings.view_count_local_flush_interval_seconds)
+        try:
+            await flush_local_view_counts()
+            if settings.view_count_buffer_enabled and loop.time() >= next_redis_flush:
+                next_redis_flush = loop.time() + settings.view_count_flush_interval_seconds
+                await flush_view_counts()
+        except Exception:
+            logger.exception("Failed to flush buffered view counts")
+
+
+def start_view_count_flusher() -> None:
+    """Start the periodic flush task (call once at startup)."""
+    global _flusher
+    if _flusher is None:
+        _flusher = asyncio.create_task(_run_flusher())
+
+
+async def stop_view_count_flusher() -> None:
+    """Stop the flush task and flush whatever is still buffered."""
+    global _flusher
+    if _flusher is None:
+        return
+
+    _flusher.cancel()
+    try:
+        await _flusher
+    except asyncio.CancelledError:
+        pass
+    _flusher = None
+
+    try:
+        await _flush_all()
+    except Exception:
+        logger.exception("Failed to flush buffered view counts on shutdown")
@@ -2,10 +2,18 @@
 Waitlist schemas for sold-out event management.
 """
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from datetime import datetime
 from typing import Optional
 
+from src.schemas.common import ORM_RESPONSE_CONFIG
+
+
+_JOIN_WAITLIST_REQUEST_EXAMPLE = {
+    "event_id": 1,
+    "tier_id": 2
+}
+
 
 class JoinWaitlistRequest(BaseModel):
     """Join waitlist request schema."""
@@ -19,14 +27,19 @@ class JoinWaitlistRequest(BaseModel):
         description="Optional: specific tier to wait for"
     )
 
-    class Config:
-        """Pydantic configuration."""
-        schema_extra = {
-            "example": {
-                "event_id": 1,
-                "tier_id": 2
-            }
-        }
+    model_config = ConfigDict(
+        json_schema_extra={"example": _JOIN_WAITLIST_REQUEST_EXAMPLE}
+    )
+
+
+_WAITLIST_RESPONSE_EXAMPLE = {
+    "id": 1,
+    "event_id": 1,
+    "position": 1,
+    "status": "waiting",
+    "notified": False,
+    "created_at": "2025-10-26T10:00:00Z"
+}
 
 
 class WaitlistResponse(BaseModel):
@@ -49,19 +62,10 @@ class WaitlistResponse(BaseModel):
     created_at: datetime = Field(description="Join timestamp")
     updated_at: datetime = Field(description="Last update timestamp")
 
-    class Config:
-        """Pydantic configuration."""
-        from_attributes = True
-        schema_extra = {
-            "example": {
-                "id": 1,
-                "event_id": 1,
-                "position": 1,
-                "status": "waiting",
-                "notified": False,
-                "created_at": "2025-10-26T10:00:00Z"
-            }
-        }
+    model_config = ConfigDict(
+        **ORM_RESPONSE_CONFIG,
+        json_schema_extra={"example": _WAITLIST_RESPONSE_EXAMPLE}
+    )
 
 
 class WaitlistDetailResponse(BaseModel):
@@ -79,9 +83,7 @@ class WaitlistDetailResponse(BaseModel):
     created_at: datetime = Field(description="Join time")
     updated_at: datetime = Field(description="Update time")
 
-    class Config:
-        """Pydantic configuration."""
-        from_attributes = True
+    model_config = ORM_RESPONSE_CONFIG
 
 
 class EventWaitlistInfo(BaseModel):
@@ -92,9 +94,7 @@ class EventWaitlistInfo(BaseModel):
     start_time: datetime = Field(description="Event start time")
     venue_name: str = Field(description="Venue name")
 
-    class Config:
-        """Pydantic configuration."""
-        from_attributes = True
+    model_config = ORM_RESPONSE_CONFIG
 
 
 class TierWaitlistInfo(BaseModel):
@@ -104,9 +104,12 @@ class TierWaitlistInfo(BaseModel):
     name: str = Field(description="Tier name")
     price: float = Field(description="Tier price")
 
-    class Config:
-        """Pydantic configuration."""
-        from_attributes = True
+    model_config = ORM_RESPONSE_CONFIG
+
+
+_LEAVE_WAITLIST_REQUEST_EXAMPLE = {
+    "reason": "Found tickets elsewhere"
+}
 
 
 class LeaveWaitlistRequest(BaseModel):
@@ -118,13 +121,18 @@ class LeaveWaitlistRequest(BaseModel):
         description="Reason for leaving"
     )
 
-    class Config:
-        """Pydantic configuration."""
-        schema_extra = {
-            "example": {
-                "reason": "Found tickets elsewhere"
-            }
-        }
+    model_config = ConfigDict(
+        json_schema_extra={"example": _LEAVE_WAITLIST_REQUEST_EXAMPLE}
+    )
+
+
+_WAITLIST_NOTIFICATION_RESPONSE_EXAMPLE = {
+    "id": 1,
+    "message": "Tickets are now available! You are first in line.",
+    "tickets_available": 5,
+    "expiration_time": "2025-10-26T12:00:00Z",
+    "action_url": "https://api.example.com/waitlist/1/purchase"
+}
 
 
 class WaitlistNotificationResponse(BaseModel):
@@ -136,34 +144,27 @@ class WaitlistNotificationResponse(BaseModel):
     expiration_time: datetime = Field(description="When this notification expires")
     action_url: str = Field(description="URL to complete purchase")
 
-    class Config:
-        """Pydantic configuration."""
-        schema_extra = {
-            "example": {
-                "id": 1,
-                "message": "Tickets are now available! You are first in line.",
-                "tickets_available": 5,
-                "expiration_time": "2025-10-26T12:00:00Z",
-                "action_url": "https://api.example.com/waitlist/1/purchase"
-            }
-        }
+    model_config = ConfigDict(
+        json_schema_extra={"example": _WAITLIST_NOTIFICATION_RESPONSE_EXAMPLE}
+    )
+
+
+_RESPOND_TO_WAITLIST_REQUEST_EXAMPLE = {
+    "action": "purchase"
+}
 
 
 class RespondToWaitlistRequest(BaseModel):
     """Respond to waitlist notification request."""
 
     action: str = Field(
-        regex="^(purchase|decline)$",
+        pattern="^(purchase|decline)$",
         description="Action to take (purchase or decline)"
     )
 
-    class Config:
-        """Pydantic configuration."""
-        schema_extra = {
-            "example": {
-                "action": "purchase"
-            }
-        }
+    model_config = ConfigDict(
+        json_schema_extra={"example": _RESPOND_TO_WAITLIST_REQUEST_EXAMPLE}
+    )
 
 
 class WaitlistListResponse(BaseModel):
@@ -176,9 +177,19 @@ class WaitlistListResponse(BaseModel):
     status: str = Field(description="Status")
     created_at: datetime = Field(description="Join timestamp")
 
-    class Config:
-        """Pydantic configuration."""
-        from_attributes = True
+    model_config = ORM_RESPONSE_CONFIG
+
+
+_JOIN_WAITLIST_RESPONSE_EXAMPLE = {
+    "message": "Successfully joined waitlist!",
+    "position": 1,
+    "estimated_wait": "2-3 weeks",
+    "waitlist": {
+        "id": 1,
+        "position": 1,
+        "status": "waiting"
+    }
+}
 
 
 class JoinWaitlistResponse(BaseModel):
@@ -192,20 +203,19 @@ class JoinWaitlistResponse(BaseModel):
         description="Estimated wait time (e.g., '2-3 weeks')"
     )
 
-    class Config:
-        """Pydantic configuration."""
-        schema_extra = {
-            "example": {
-                "message": "Successfully joined waitlist!",
-                "position": 1,
-                "estimated_wait": "2-3 weeks",
-                "waitlist": {
-                    "id": 1,
-                    "position": 1,
-                    "status": "waiting"
-                }
-            }
-        }
+    model_config = ConfigDict(
+        json_schema_extra={"example": _JOIN_WAITLIST_RESPONSE_EXAMPLE}
+    )
+
+
+_WAITLIST_METRICS_RESPONSE_EXAMPLE = {
+    "event_id": 1,
+    "total_waitlist_count": 50,
+    "waiting_count": 30,
+    "notified_count": 15,
+    "fulfilled_count": 5,
+    "expired_count": 0
+}
 
 
 class WaitlistMetricsResponse(BaseModel):
@@ -220,18 +230,16 @@ class WaitlistMetricsResponse(BaseModel):
     fulfilled_count: int = Field(description="Count of fulfilled requests")
     expired_count: int = Field(description="Count of expired notifications")
 
-    class Config:
-        """Pydantic configuration."""
-        schema_extra = {
-            "example": {
-                "event_id": 1,
-                "total_waitlist_count": 50,
-                "waiting_count": 30,
-                "notified_count": 15,
-                "fulfilled_count": 5,
-                "expired_count": 0
-            }
-        }
+    model_config = ConfigDict(
+        json_schema_extra={"example": _WAITLIST_METRICS_RESPONSE_EXAMPLE}
+    )
+
+
+_BULK_NOTIFY_WAITLIST_REQUEST_EXAMPLE = {
+    "event_id": 1,
+    "count": 20,
+    "message": "Great news! More tickets have become available!"
+}
 
 
 class BulkNotifyWaitlistRequest(BaseModel):
@@ -251,15 +259,16 @@ class BulkNotifyWaitlistRequest(BaseModel):
         description="Custom message to include in notification"
     )
 
-    class Config:
-        """Pydantic configuration."""
-        schema_extra = {
-            "example": {
-                "event_id": 1,
-                "count": 20,
-                "message": "Great news! More tickets have become available!"
-            }
-        }
+    model_config = ConfigDict(
+        json_schema_extra={"example": _BULK_NOTIFY_WAITLIST_REQUEST_EXAMPLE}
+    )
+
+
+_BULK_NOTIFY_RESPONSE_EXAMPLE = {
+    "event_id": 1,
+    "notified_count": 20,
+    "message": "Successfully notified 20 users from the waitlist"
+}
 
 
 class BulkNotifyResponse(BaseModel):
@@ -269,15 +278,9 @@ class BulkNotifyResponse(BaseModel):
     notified_count: int = Field(description="Number of users notified")
     message: str = Field(description="Status message")
 
-    class Config:
-        """Pydantic configuration."""
-        schema_extra = {
-            "example": {
-                "event_id": 1,
-                "notified_count": 20,
-                "message": "Successfully notified 20 users from the waitlist"
-            }
-        }
+    model_config = ConfigDict(
+        json_schema_extra={"example": _BULK_NOTIFY_RESPONSE_EXAMPLE}
+    )
 
 
 # Update forward references